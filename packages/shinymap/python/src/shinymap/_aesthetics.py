@@ -20,7 +20,7 @@ parent-relative values:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, fields, replace
+from dataclasses import dataclass, field, fields, replace
 from typing import TYPE_CHECKING, Any, Literal
 
 from ._sentinel import MISSING, MissingType
@@ -389,7 +389,7 @@ class ByGroup:
         return f"ByGroup({', '.join(parts)})"
 
 
-@dataclass
+@dataclass(frozen=True)
 class IndexedAesthetic:
     """Index-based aesthetic for multi-state modes (Cycle, Count).
 
@@ -428,9 +428,12 @@ class IndexedAesthetic:
     stroke_color: str | list[str] | None = None
     stroke_width: float | list[float] | None = None
     stroke_dasharray: str | list[str] | None = None
+    _dict_cache: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dict for serialization to JavaScript."""
+        """Convert to dict for serialization to JavaScript (built once; do not mutate)."""
+        if self._dict_cache is not None:
+            return self._dict_cache
         result: dict[str, Any] = {}
         if self.fill_color is not None:
             result["fillColor"] = self.fill_color
@@ -442,6 +445,7 @@ class IndexedAesthetic:
             result["strokeWidth"] = self.stroke_width
         if self.stroke_dasharray is not None:
             result["strokeDasharray"] = self.stroke_dasharray
+        object.__setattr__(self, "_dict_cache", result)
         return result
 
     def __repr__(self) -> str:
@@ -6,11 +6,11 @@ Use wash().input_map() or the public input_map() instead.
 
 from __future__ import annotations
 
-import json
 from collections.abc import Mapping, MutableMapping
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import TYPE_CHECKING, Any, Literal
 
+import orjson
 from htmltools import HTMLDependency, TagList, css
 from shiny import render, ui
 
@@ -22,7 +22,17 @@ from ._aesthetics import (
     PathAesthetic,
 )
 from ._sentinel import MISSING, MissingType
-from .mode import Count, Cycle, ModeType, Multiple, Single
+from .geometry._regions import _content_key
+from .mode import (
+    _STRING_MODES,
+    Count,
+    Cycle,
+    ModeType,
+    Multiple,
+    Single,
+    _initial_value,
+    _serialize_mode,
+)
 
 if TYPE_CHECKING:
     from ._wash import WashConfig
@@ -34,7 +44,9 @@ FillMap = str | Mapping[str, str] | None
 CountMap = Mapping[str, int] | None
 
 
+@lru_cache(maxsize=1)
 def _dependency() -> HTMLDependency:
+    """The shinymap JS dependency, built once; htmltools dedupes it by name and version."""
     return HTMLDependency(
         name="shinymap",
         version=__version__,
@@ -54,35 +66,58 @@ def _merge_styles(
     return merged
 
 
+@lru_cache(maxsize=64)
+def _size_css(width: str | None, height: str | None) -> str | None:
+    """Inline CSS for a width/height pair; the same few pairs are reused on every render."""
+    return css(**_merge_styles(width, height, None))
+
+
+def _style_css(
+    width: str | None, height: str | None, style: MutableMapping[str, str] | None
+) -> str | None:
+    """Inline CSS for a map container: width/height defaults plus any extra style."""
+    if not style:
+        return _size_css(width, height)
+    return css(**_merge_styles(width, height, style))
+
+
 def _class_names(base: str, extra: str | None) -> str:
     return f"{base} {extra}" if extra else base
 
 
+@lru_cache(maxsize=256)
 def _to_camel(snake_str: str) -> str:
-    """Convert snake_case to camelCase."""
+    """Convert snake_case to camelCase.
+
+    Cached: only a small, fixed vocabulary of attribute names ever passes through.
+    """
     components = snake_str.split("_")
     return components[0] + "".join(x.title() for x in components[1:])
 
 
-def _normalize_geometry(geometry: GeometryMap) -> Mapping[str, list[dict[str, Any]]]:
-    """Normalize geometry to Element list format for JavaScript."""
+def _to_camel_dict(d: dict[str, Any]) -> dict[str, Any]:
+    """Convert the keys of an element dict to camelCase."""
+    return {_to_camel(k): v for k, v in d.items()}
 
-    def _to_camel_dict(d: dict[str, Any]) -> dict[str, Any]:
-        return {_to_camel(k): v for k, v in d.items()}
 
+def _normalize_geometry(geometry: GeometryMap) -> dict[str, list[dict[str, Any]]]:
+    """Normalize geometry to Element list format for JavaScript."""
     result: dict[str, list[dict[str, Any]]] = {}
     for region_id, value in geometry.items():
         if isinstance(value, str):
             result[region_id] = [{"type": "path", "d": value}]
         elif isinstance(value, list):
+            # Hoist the append and converter lookups out of the per-element loop
             elements: list[dict[str, Any]] = []
+            append = elements.append
+            to_camel_dict = _to_camel_dict
             for item in value:
                 if isinstance(item, str):
-                    elements.append({"type": "path", "d": item})
+                    append({"type": "path", "d": item})
                 elif hasattr(item, "to_dict"):
-                    elements.append(_to_camel_dict(item.to_dict()))
+                    append(to_camel_dict(item.to_dict()))
                 elif isinstance(item, dict):
-                    elements.append(_to_camel_dict(item))
+                    append(to_camel_dict(item))
             result[region_id] = elements
         elif hasattr(value, "to_dict"):
             result[region_id] = [_to_camel_dict(value.to_dict())]
@@ -91,6 +126,29 @@ def _normalize_geometry(geometry: GeometryMap) -> Mapping[str, list[dict[str, An
     return result
 
 
+# Normalized geometry payloads, least recently used first, keyed by _content_key; every
+# entry keeps the keyed elements alive so their ids cannot be reused while it is cached.
+_GEOMETRY_PAYLOAD_CACHE_SIZE = 16
+_geometry_payloads: dict[tuple[Any, ...], tuple[list[Any], dict[str, list[dict[str, Any]]]]] = {}
+
+
+def _geometry_payload(geometry: Mapping[str, Any]) -> dict[str, list[dict[str, Any]]]:
+    """Normalized geometry, reused across renders while the regions hold the same elements.
+
+    Replacing, adding or removing regions or elements (e.g. through geometry.regions)
+    changes the key, so the next render rebuilds the payload. Attribute edits on an
+    existing element object are not detected. The returned dict is shared: do not mutate.
+    """
+    key, elements = _content_key(geometry)
+    entry = _geometry_payloads.pop(key, None)
+    if entry is None:
+        entry = (elements, _normalize_geometry(geometry))
+        if len(_geometry_payloads) >= _GEOMETRY_PAYLOAD_CACHE_SIZE:
+            del _geometry_payloads[next(iter(_geometry_payloads))]
+    _geometry_payloads[key] = entry
+    return entry[1]
+
+
 def _normalize_fills(fills: FillMap, geometry: GeometryMap) -> Mapping[str, str] | None:
     """Normalize fills to a dict. If fills is a string, apply to all regions."""
     if fills is None:
@@ -162,6 +220,25 @@ def _camel_props(data: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
     return out
 
 
+@lru_cache(maxsize=32, typed=True)
+def _format_viewbox(x: float, y: float, width: float, height: float) -> str:
+    """Format viewBox components as an SVG viewBox string.
+
+    Cached because the same few viewBoxes are formatted again on every render.
+    typed=True keeps (0, 0, 100, 100) and (0.0, 0.0, 100.0, 100.0) distinct.
+    """
+    return f"{x} {y} {width} {height}"
+
+
+def _to_json(data: Any) -> str:
+    """Serialize a props payload to a JSON string for a data-* attribute.
+
+    Uses orjson so pre-serialized parts (orjson.Fragment) can be embedded as-is.
+    Non-string keys and numpy values are accepted, matching what callers may pass.
+    """
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
 def _merge_lines_as_path_into_aes(
     aes: ByGroup | ByState | BaseAesthetic | None | MissingType,
     lines_as_path: list[str],
@@ -181,36 +258,26 @@ def _merge_lines_as_path_into_aes(
     if not lines_as_path:
         return aes
 
-    # Build group entries for lines_as_path regions
-    line_group_entries: dict[str, ByState | BaseAesthetic | None | MissingType] = {}
-    for region_id in lines_as_path:
-        line_group_entries[region_id] = PathAesthetic(kind="line")
+    # Build group entries for lines_as_path regions in one pass, sharing a single
+    # line aesthetic (entries are only read when converted to dicts)
+    line_group_entries: dict[str, ByState | BaseAesthetic | None | MissingType] = dict.fromkeys(
+        lines_as_path, PathAesthetic(kind="line")
+    )
 
     # Merge with existing aes
     if isinstance(aes, MissingType) or aes is None:
         # No user aes - create ByGroup with just the line entries
         return ByGroup(**line_group_entries)
     elif isinstance(aes, ByGroup):
-        # Merge: user entries take priority
-        merged_entries = dict(line_group_entries)
+        # Merge: user entries take priority (line_group_entries is ours to extend)
         for key in aes.keys():
-            merged_entries[key] = aes[key]
-        return ByGroup(**merged_entries)
-    elif isinstance(aes, ByState):
-        # User provided ByState for global config - wrap in ByGroup and add line entries
-        # ByState applies to __all, line entries apply to specific regions
-        bystate_entries: dict[str, ByState | BaseAesthetic | None | MissingType] = dict(
-            line_group_entries
-        )
-        bystate_entries["__all"] = aes
-        return ByGroup(**bystate_entries)
-    elif isinstance(aes, BaseAesthetic):
-        # User provided single aesthetic - wrap in ByGroup
-        base_entries: dict[str, ByState | BaseAesthetic | None | MissingType] = dict(
-            line_group_entries
-        )
-        base_entries["__all"] = aes
-        return ByGroup(**base_entries)
+            line_group_entries[key] = aes[key]
+        return ByGroup(**line_group_entries)
+    elif isinstance(aes, ByState | BaseAesthetic):
+        # User provided ByState or a single aesthetic for global config - wrap in
+        # ByGroup under __all; line entries apply to specific regions
+        line_group_entries["__all"] = aes
+        return ByGroup(**line_group_entries)
     else:
         return aes
 
@@ -228,6 +295,10 @@ def _convert_aes_to_dict(
     Returns:
         Dict with keys: base, hover, select, group (ready for _camel_props)
     """
+    # Nothing to convert: no wash defaults and no call-site aes
+    if wash_config is None and isinstance(aes, MissingType):
+        return None
+
     # Import here to avoid circular dependency
     from ._wash import WashConfig, _convert_to_aes_dict
 
@@ -283,15 +354,15 @@ def base_input_map(
     Returns:
         TagList containing the input component.
     """
-    # Normalize string modes to Mode class instances
-    mode_obj: Single | Multiple | Cycle | Count
-    if mode == "single":
-        mode_obj = Single()
-    elif mode == "multiple":
-        mode_obj = Multiple()
+    # Normalize string modes to Mode class instances (shared frozen defaults)
+    mode_obj: Single | Multiple | Cycle | Count | None
+    if isinstance(mode, str):
+        mode_obj = _STRING_MODES.get(mode)
     elif isinstance(mode, (Single, Multiple, Cycle, Count)):
         mode_obj = mode
     else:
+        mode_obj = None
+    if mode_obj is None:
         raise ValueError(
             'mode must be "single", "multiple", or a Mode class instance '
             "(Single, Multiple, Cycle, Count)"
@@ -299,18 +370,10 @@ def base_input_map(
 
     # Geometry
     vb_tuple = view_box if view_box else geometry.viewbox()
-    vb_str = f"{vb_tuple[0]} {vb_tuple[1]} {vb_tuple[2]} {vb_tuple[3]}"
-    all_regions = geometry.regions
+    vb_str = _format_viewbox(*vb_tuple)
 
     # Determine initial value from Mode class if not provided
-    effective_value = value
-    if effective_value is None:
-        if isinstance(mode_obj, Single) and mode_obj.selected is not None:
-            effective_value = {mode_obj.selected: 1}
-        elif isinstance(mode_obj, Multiple) and mode_obj.selected is not None:
-            effective_value = {s: 1 for s in mode_obj.selected}
-        elif isinstance(mode_obj, (Cycle, Count)) and mode_obj.values is not None:
-            effective_value = mode_obj.values
+    effective_value = value if value is not None else _initial_value(mode_obj)
 
     # Geometry metadata
     geometry_metadata = None
@@ -323,15 +386,17 @@ def base_input_map(
         if not geometry_metadata:
             geometry_metadata = None
 
-    # Build mode config from Mode object
-    mode_config = mode_obj.to_dict()
+    # Build mode config from Mode object; embedded as pre-serialized JSON
+    # (shared across equal hashable modes)
+    mode_config = orjson.Fragment(_serialize_mode(mode_obj))
 
-    # Build layers config (merge with geometry defaults)
-    effective_layers = dict(layers) if layers else {}
+    # Build layers config (merge with geometry defaults); the caller's layers are
+    # copied once, and only when geometry overlays actually have to be added
+    effective_layers = layers if isinstance(layers, dict) else dict(layers or {})
     if "overlays" not in effective_layers:
         geo_overlays = geometry.overlays()
         if geo_overlays:
-            effective_layers["overlays"] = geo_overlays
+            effective_layers = {**effective_layers, "overlays": geo_overlays}
 
     # Merge lines_as_path from geometry into aes
     lines_as_path = geometry.metadata.get("lines_as_path", [])
@@ -342,7 +407,7 @@ def base_input_map(
 
     # Build props with new nested structure
     props_dict: dict[str, Any] = {
-        "geometry": _normalize_geometry(all_regions),  # type: ignore[arg-type]
+        "geometry": _geometry_payload(geometry.regions),
         "tooltips": tooltips,
         "view_box": vb_str,
         "geometry_metadata": geometry_metadata,
@@ -353,16 +418,16 @@ def base_input_map(
     }
 
     props = _camel_props(props_dict)
-    mode_type = mode_config["type"]
+    mode_type = mode_obj.to_dict()["type"]
 
     div = ui.div(
         id=id,
         class_=_class_names("shinymap-input", class_),
-        style=css(**_merge_styles(width, height, style)),
+        style=_style_css(width, height, style),
         data_shinymap_input="1",
         data_shinymap_input_id=id,
         data_shinymap_input_mode=mode_type,
-        data_shinymap_props=json.dumps(props),
+        data_shinymap_props=_to_json(props),
     )
 
     return TagList(_dependency(), div)
@@ -421,7 +486,7 @@ def base_output_map(
             vb_tuple = geometry.viewbox()
         else:
             vb_tuple = view_box
-        processed_view_box = f"{vb_tuple[0]} {vb_tuple[1]} {vb_tuple[2]} {vb_tuple[3]}"
+        processed_view_box = _format_viewbox(*vb_tuple)
 
         # Use metadata overlays if not explicitly provided
         if overlays is None:
@@ -433,7 +498,7 @@ def base_output_map(
     else:
         effective_aes = aes
         if view_box is not None:
-            processed_view_box = f"{view_box[0]} {view_box[1]} {view_box[2]} {view_box[3]}"
+            processed_view_box = _format_viewbox(*view_box)
 
     # Convert aes objects to dict format
     aes_dict = _convert_aes_to_dict(effective_aes, wash_config)
@@ -448,27 +513,25 @@ def base_output_map(
         if not geometry_metadata:
             geometry_metadata = None
 
+    # Store layers as nested dict, keeping only the layers that were given
+    static_layers = {
+        key: ids
+        for key, ids in (("underlays", underlays), ("overlays", overlays), ("hidden", hidden))
+        if ids is not None
+    }
+    # Keep only parameters that were given, in a single pass
     static_params: dict[str, Any] = {
-        "geometry": processed_geometry,
-        "tooltips": tooltips,
-        "view_box": processed_view_box,
-        "aes": aes_dict,
-        "layers": {  # Store as nested dict
-            "underlays": underlays,
-            "overlays": overlays,
-            "hidden": hidden,
-        },
-        "geometry_metadata": geometry_metadata,
+        key: value
+        for key, value in (
+            ("geometry", processed_geometry),
+            ("tooltips", tooltips),
+            ("view_box", processed_view_box),
+            ("aes", aes_dict),
+            ("layers", static_layers or None),
+            ("geometry_metadata", geometry_metadata),
+        )
+        if value is not None
     }
-    # Clean up None values in layers
-    if static_params["layers"]:
-        static_params["layers"] = {
-            k: v for k, v in static_params["layers"].items() if v is not None
-        }
-        if not static_params["layers"]:
-            static_params["layers"] = None
-
-    static_params = {k: v for k, v in static_params.items() if v is not None}
 
     if static_params:
         _static_map_params[id] = static_params
@@ -478,7 +541,7 @@ def base_output_map(
         ui.div(
             ui.output_ui(id),
             class_=_class_names("shinymap-output-container", class_),
-            style=css(**_merge_styles(width, height, style)),
+            style=_style_css(width, height, style),
         ),
     )
 
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import json
 from collections.abc import Mapping, MutableMapping
 from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
 
-from htmltools import Tag, TagList, css
-from shiny import ui
+from htmltools import Tag, TagList
+from shiny import reactive, ui
 from shiny.session import Session, require_active_session
 
 from ._aesthetics import BaseAesthetic, ByGroup, ByState
@@ -16,8 +16,10 @@ from ._base import (
     _class_names,
     _convert_aes_to_dict,
     _dependency,
-    _merge_styles,
-    _normalize_geometry,
+    _format_viewbox,
+    _geometry_payload,
+    _style_css,
+    _to_json,
 )
 
 if TYPE_CHECKING:
@@ -29,6 +31,10 @@ AesType = ByGroup | ByState | BaseAesthetic | Mapping[str, Mapping[str, Any] | N
 # Module-level registry for static parameters from output_map()
 _static_map_params: MutableMapping[str, Mapping[str, Any]] = {}
 
+# update_map() messages waiting for the next reactive flush, keyed by root session and then
+# by namespaced map id, so calls from module sessions share one queue in call order
+_pending_map_updates: WeakKeyDictionary[Session, dict[str, dict[str, Any]]] = WeakKeyDictionary()
+
 
 def _viewbox_to_str(view_box: tuple[float, float, float, float] | str | None) -> str | None:
     """Convert viewBox tuple to string format, or pass through string."""
@@ -36,7 +42,7 @@ def _viewbox_to_str(view_box: tuple[float, float, float, float] | str | None) ->
         return None
     if isinstance(view_box, str):
         return view_box
-    return f"{view_box[0]} {view_box[1]} {view_box[2]} {view_box[3]}"
+    return _format_viewbox(*view_box)
 
 
 # Public input_map uses wash() with sensible defaults
@@ -69,6 +75,17 @@ class MapBuilder:
             return Map().with_value(my_counts)
     """
 
+    __slots__ = (
+        "_regions",
+        "_tooltips",
+        "_value",
+        "_active_ids",
+        "_view_box",
+        "_aes",
+        "_layers",
+        "_geometry_metadata",
+    )
+
     def __init__(
         self,
         regions: Mapping[str, Any] | None = None,
@@ -90,6 +107,7 @@ class MapBuilder:
         self._view_box = view_box
         self._aes: AesType = None
         self._layers: Mapping[str, list[str] | None] | None = None
+        self._geometry_metadata: Mapping[str, Any] | None = None
 
     def with_tooltips(self, tooltips: TooltipMap) -> MapBuilder:
         """Set region tooltips."""
@@ -139,7 +157,7 @@ class MapBuilder:
         data: dict[str, Any] = {}
 
         if self._regions is not None:
-            data["geometry"] = _normalize_geometry(self._regions)
+            data["geometry"] = _geometry_payload(self._regions)
         if self._tooltips is not None:
             data["tooltips"] = self._tooltips
         if self._value is not None:
@@ -156,7 +174,7 @@ class MapBuilder:
                 data["aes"] = self._aes
         if self._layers is not None:
             data["layers"] = self._layers
-        if hasattr(self, "_geometry_metadata") and self._geometry_metadata is not None:
+        if self._geometry_metadata is not None:
             data["geometry_metadata"] = self._geometry_metadata
 
         return _camel_props(data)
@@ -253,9 +271,9 @@ def _render_map_ui(
     payload_dict = builder.as_json()
     div = ui.div(
         class_=_class_names("shinymap-output", class_),
-        style=css(**_merge_styles(width, height, style)),
+        style=_style_css(width, height, style),
         data_shinymap_output="1",
-        data_shinymap_payload=json.dumps(payload_dict),
+        data_shinymap_payload=_to_json(payload_dict),
         data_shinymap_click_input_id=click_input_id if click_input_id else None,
     )
 
@@ -296,24 +314,17 @@ def _apply_static_params(builder: MapBuilder, output_id: str) -> MapBuilder:
     if builder._aes is not None and static_aes is not None:
         # Need to merge: static aes contains lines_as_path entries, builder aes is user-provided
         # Convert builder aes to dict and merge with static
-        from ._base import _convert_aes_to_dict
-
         builder_aes_dict = (
             _convert_aes_to_dict(builder._aes)
             if isinstance(builder._aes, (ByGroup, ByState, BaseAesthetic))
             else builder._aes
         )
-        # Deep merge: static group entries are base, builder entries override
-        merged_aes: dict[str, Any] = dict(static_aes) if static_aes else {}
-        if builder_aes_dict:
-            for key, value in builder_aes_dict.items():
-                if key == "group" and isinstance(value, dict):
-                    # Merge group entries: builder overrides static
-                    if "group" not in merged_aes:
-                        merged_aes["group"] = {}
-                    merged_aes["group"] = {**merged_aes.get("group", {}), **value}
-                else:
-                    merged_aes[key] = value
+        # Builder keys override static keys; group entries are merged one level deeper
+        merged_aes: dict[str, Any] = {**static_aes, **(builder_aes_dict or {})}
+        builder_group = builder_aes_dict.get("group") if builder_aes_dict else None
+        static_group = static_aes.get("group")
+        if isinstance(builder_group, dict) and static_group:
+            merged_aes["group"] = {**static_group, **builder_group}
         merged._aes = merged_aes
     elif builder._aes is not None:
         merged._aes = builder._aes
@@ -329,7 +340,7 @@ def _apply_static_params(builder: MapBuilder, output_id: str) -> MapBuilder:
 
     # Geometry metadata
     static_metadata = static_params.get("geometry_metadata")
-    if hasattr(builder, "_geometry_metadata") and builder._geometry_metadata is not None:
+    if builder._geometry_metadata is not None:
         merged._geometry_metadata = builder._geometry_metadata
     elif static_metadata is not None:
         merged._geometry_metadata = static_metadata
@@ -397,45 +408,75 @@ def update_map(
     Note:
         - Uses shallow merge semantics: new properties override existing ones
         - Properties not specified are left unchanged
+        - Calls made while Shiny processes a reactive update (observers, effects) are sent
+          at the next reactive flush; several calls for the same map are merged into a
+          single message. Calls made outside one (e.g. a download handler) are sent
+          immediately, unless another session is mid-update; they then go out with
+          that update's flush
         - For output_map data updates, use @render_map re-execution instead
     """
     session = require_active_session(session)
 
-    # Build update payload
+    # Build update payload with the camelCase keys JavaScript expects
     updates: dict[str, Any] = {}
 
     if fill_color is not None:
-        updates["fill_color"] = fill_color
+        updates["fillColor"] = fill_color
     if stroke_width is not None:
-        updates["stroke_width"] = stroke_width
+        updates["strokeWidth"] = stroke_width
     if stroke_color is not None:
-        updates["stroke_color"] = stroke_color
+        updates["strokeColor"] = stroke_color
     if fill_opacity is not None:
-        updates["fill_opacity"] = fill_opacity
+        updates["fillOpacity"] = fill_opacity
     if aes_base is not None:
-        updates["aes_base"] = aes_base
+        updates["aesBase"] = aes_base
     if aes_select is not None:
-        updates["aes_select"] = aes_select
+        updates["aesSelect"] = aes_select
     if aes_hover is not None:
-        updates["aes_hover"] = aes_hover
+        updates["aesHover"] = aes_hover
     if value is not None:
         updates["value"] = value
     if cycle is not None:
         updates["cycle"] = cycle
     if max_selection is not None:
-        updates["max_selection"] = max_selection
+        updates["maxSelection"] = max_selection
     if tooltips is not None:
         updates["tooltips"] = tooltips
 
     if not updates:
         return  # Nothing to update
 
-    # Convert to camelCase for JavaScript
-    camel_updates = _camel_props(updates)
-
-    # Send custom message to JavaScript
-    msg = {"id": id, "updates": camel_updates}
-    session._send_message_sync({"custom": {"shinymap-update": msg}})
+    root = session.root_scope()
+    key = session.ns(id)
+    pending = _pending_map_updates.get(root)
+
+    # Shiny holds the reactive lock while handling client messages and flushes before
+    # releasing it. Without the lock (e.g. a download handler or a plain asyncio
+    # callback) no flush is coming, so send now, folding in anything still queued.
+    # The lock is shared by all sessions; if another session holds it, the update is
+    # queued and goes out with that session's flush, which flushes every session.
+    if not reactive.lock().locked():
+        if pending is not None and key in pending:
+            updates = {**pending.pop(key)["updates"], **updates}
+        msg = {"id": id, "updates": updates}
+        root._send_message_sync({"custom": {"shinymap-update": msg}})
+        return
+
+    # Queue for the next flush; later calls for the same map override earlier keys,
+    # matching the shallow merge JavaScript applies to each message
+    if pending is None:
+        pending = _pending_map_updates[root] = {}
+        root.on_flush(lambda: _send_pending_map_updates(root))
+    pending.setdefault(key, {"id": id, "updates": {}})["updates"].update(updates)
+
+
+def _send_pending_map_updates(session: Session) -> None:
+    """Send one custom message per map with the update_map() calls queued this flush."""
+    pending = _pending_map_updates.pop(session, None)
+    if not pending:
+        return
+    for msg in pending.values():
+        session._send_message_sync({"custom": {"shinymap-update": msg}})
 
 
 # =============================================================================
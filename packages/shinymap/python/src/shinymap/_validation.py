@@ -7,7 +7,7 @@ applying inappropriate aesthetics to elements (e.g., fill on lines).
 from __future__ import annotations
 
 import warnings
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -38,28 +38,27 @@ def _collect_element_types(
     # Handle Geometry object (has .regions attribute that is dict-like)
     if hasattr(geometry, "regions"):
         regions_obj = geometry.regions
-        # Regions object is dict-like, iterate over it
-        region_ids = [region_id] if region_id else list(regions_obj.keys())
-        for rid in region_ids:
-            if rid not in regions_obj:
-                continue
-            elements = regions_obj[rid]
-            if isinstance(elements, list):
-                for element in elements:
-                    # Element dataclass - use class name as element type
-                    elem_type = type(element).__name__.lower()
-                    element_types.add(elem_type)
+        region_ids = [region_id] if region_id else regions_obj.keys()
+        # Element dataclass - use class name as element type. Collect the distinct
+        # classes first so the name is derived once per type, not once per element.
+        element_classes = {
+            type(element)
+            for rid in region_ids
+            if isinstance(elements := regions_obj.get(rid), list)
+            for element in elements
+        }
+        element_types.update(cls.__name__.lower() for cls in element_classes)
     else:
         # Handle raw dict
-        regions_dict = {k: v for k, v in geometry.items() if not k.startswith("_")}
-
-        # Filter to specific region if requested
         if region_id is not None:
-            if region_id not in regions_dict:
+            # Look up the one region directly instead of filtering the whole dict
+            if region_id.startswith("_") or region_id not in geometry:
                 return element_types
-            regions_dict = {region_id: regions_dict[region_id]}
+            regions_values: Iterable[Any] = (geometry[region_id],)
+        else:
+            regions_values = (v for k, v in geometry.items() if not k.startswith("_"))
 
-        for elements in regions_dict.values():
+        for elements in regions_values:
             if isinstance(elements, list):
                 for element in elements:
                     if isinstance(element, dict) and "type" in element:
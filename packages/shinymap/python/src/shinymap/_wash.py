@@ -268,22 +268,25 @@ def _get_wash_defaults_for_kind(config: WashConfig, kind: str) -> dict[str, Any]
     Returns a dict of default aesthetic values from the wash config
     for the specified element kind.
     """
-    defaults: dict[str, Any] = {}
-
+    # Pick the element type's states once ("shape" or default), then check them once
     if kind == "line":
-        if not isinstance(config.line, MissingType) and config.line is not None:
-            if not isinstance(config.line.base, MissingType) and config.line.base is not None:
-                defaults = config.line.base.to_dict()
+        states: (
+            ByState[ShapeAesthetic]
+            | ByState[LineAesthetic]
+            | ByState[TextAesthetic]
+            | None
+            | MissingType
+        ) = config.line
     elif kind == "text":
-        if not isinstance(config.text, MissingType) and config.text is not None:
-            if not isinstance(config.text.base, MissingType) and config.text.base is not None:
-                defaults = config.text.base.to_dict()
-    else:  # "shape" or default
-        if not isinstance(config.shape, MissingType) and config.shape is not None:
-            if not isinstance(config.shape.base, MissingType) and config.shape.base is not None:
-                defaults = config.shape.base.to_dict()
+        states = config.text
+    else:
+        states = config.shape
 
-    return defaults
+    if isinstance(states, MissingType) or states is None:
+        return {}
+    if isinstance(states.base, MissingType) or states.base is None:
+        return {}
+    return states.base.to_dict()
 
 
 def _apply_path_kind_defaults(aesthetic: BaseAesthetic, config: WashConfig) -> dict[str, Any]:
@@ -306,6 +309,22 @@ def _apply_path_kind_defaults(aesthetic: BaseAesthetic, config: WashConfig) -> d
         return aesthetic.to_dict()
 
 
+def _group_entry(
+    group_value: ByState | BaseAesthetic | None | MissingType, config: WashConfig
+) -> dict[str, Any] | MissingType:
+    """Resolve one ByGroup value to its group aesthetic dict, or MISSING to omit it."""
+    if isinstance(group_value, ByState):
+        # Extract base aesthetic for the group
+        if not isinstance(group_value.base, MissingType) and group_value.base is not None:
+            return _apply_path_kind_defaults(group_value.base, config)
+        return MISSING
+    if isinstance(group_value, BaseAesthetic):
+        return _apply_path_kind_defaults(group_value, config)
+    if group_value is None:
+        return {}
+    return MISSING
+
+
 def _convert_to_legacy_format(
     config: WashConfig, aes: AesParam
 ) -> tuple[
@@ -377,6 +396,12 @@ def _convert_to_aes_dict(config: WashConfig, aes: AesParam) -> dict[str, Any] |
     Each value is a dict of aesthetic properties ready for JavaScript (snake_case keys).
     The _camel_props function in _base.py will convert to camelCase when serializing.
     """
+    # Fast path: no shape defaults from the wash and no call-site aes
+    if isinstance(aes, MissingType) and (
+        config.shape is None or isinstance(config.shape, MissingType)
+    ):
+        return None
+
     result: dict[str, Any] = {}
 
     # Step 1: Extract from wash config (shape element type for now)
@@ -395,16 +420,16 @@ def _convert_to_aes_dict(config: WashConfig, aes: AesParam) -> dict[str, Any] |
     # Step 2: Apply call-site overrides
     if isinstance(aes, ByGroup):
         aes_group: dict[str, Any] = {}
+        # Many groups can share one aesthetic object (e.g. every lines_as_path
+        # region), so each distinct value is resolved once and reused by identity
+        resolved: dict[int, dict[str, Any] | MissingType] = {}
         for group_name in aes.keys():
             group_value = aes[group_name]
-            if isinstance(group_value, ByState):
-                # Extract base aesthetic for the group
-                if not isinstance(group_value.base, MissingType) and group_value.base is not None:
-                    aes_group[group_name] = _apply_path_kind_defaults(group_value.base, config)
-            elif isinstance(group_value, BaseAesthetic):
-                aes_group[group_name] = _apply_path_kind_defaults(group_value, config)
-            elif group_value is None:
-                aes_group[group_name] = {}
+            entry = resolved.get(id(group_value))
+            if entry is None:
+                entry = resolved[id(group_value)] = _group_entry(group_value, config)
+            if not isinstance(entry, MissingType):
+                aes_group[group_name] = entry
         if aes_group:
             result["group"] = aes_group
     elif isinstance(aes, ByState):
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import re
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import Any
 
 # Type alias for bounds calculator functions
 BoundsCalculator = Callable[[str], tuple[float, float, float, float]]
 
+# Numeric coordinates in path data (handles negative, decimals)
+_COORD_RE = re.compile(r"[-]?\d+\.?\d*")
+
 
 def _parse_svg_dimension(value: str) -> float | None:
     """Parse SVG dimension value to float (handles px, pt, mm, etc.).
@@ -86,6 +89,19 @@ def _find_complex_commands(path: str) -> set[str]:
     return {cmd.upper() for cmd in matches}
 
 
+def _union_bounds(
+    all_bounds: list[tuple[float, float, float, float]],
+) -> tuple[float, float, float, float]:
+    """Combine per-element (min_x, min_y, max_x, max_y) bounds into one box.
+
+    Transposes once with zip() so each extreme is a single built-in min/max
+    over a tuple rather than a generator pass over the list. all_bounds must
+    not be empty.
+    """
+    min_xs, min_ys, max_xs, max_ys = zip(*all_bounds, strict=True)
+    return (min(min_xs), min(min_ys), max(max_xs), max(max_ys))
+
+
 def _compute_bounds_accurate(paths: dict[str, str]) -> tuple[float, float, float, float]:
     """Compute accurate bounding box using svgpathtools if available, fallback to regex.
 
@@ -120,12 +136,7 @@ def _compute_bounds_accurate(paths: dict[str, str]) -> tuple[float, float, float
         if not all_bounds:
             return (0.0, 0.0, 0.0, 0.0)
 
-        min_x = min(b[0] for b in all_bounds)
-        min_y = min(b[1] for b in all_bounds)
-        max_x = max(b[2] for b in all_bounds)
-        max_y = max(b[3] for b in all_bounds)
-
-        return (min_x, min_y, max_x, max_y)
+        return _union_bounds(all_bounds)
 
     except ImportError:
         # svgpathtools not available - fall back to regex for all paths
@@ -134,12 +145,7 @@ def _compute_bounds_accurate(paths: dict[str, str]) -> tuple[float, float, float
         if not all_bounds:
             return (0.0, 0.0, 0.0, 0.0)
 
-        min_x = min(b[0] for b in all_bounds)
-        min_y = min(b[1] for b in all_bounds)
-        max_x = max(b[2] for b in all_bounds)
-        max_y = max(b[3] for b in all_bounds)
-
-        return (min_x, min_y, max_x, max_y)
+        return _union_bounds(all_bounds)
 
 
 def _parse_svg_path_bounds(path_d: str) -> tuple[float, float, float, float]:
@@ -163,19 +169,34 @@ def _parse_svg_path_bounds(path_d: str) -> tuple[float, float, float, float]:
         >>> _parse_svg_path_bounds("M 0 0 L 100 0 L 100 100 Z")
         (0.0, 0.0, 100.0, 100.0)
     """
-    # Extract all numbers (handles negative, decimals)
-    coord_pattern = r"[-]?\d+\.?\d*"
-    coords = re.findall(coord_pattern, path_d)
+    # Convert every number once, then split x/y with C-level slicing
+    coords = list(map(float, _COORD_RE.findall(path_d)))
 
     if len(coords) < 2:
         return (0.0, 0.0, 0.0, 0.0)
 
-    x_coords = [float(coords[i]) for i in range(0, len(coords), 2)]
-    y_coords = [float(coords[i]) for i in range(1, len(coords), 2)]
+    x_coords = coords[0::2]
+    y_coords = coords[1::2]
 
     return (min(x_coords), min(y_coords), max(x_coords), max(y_coords))
 
 
+def _iter_geometry_paths(geometry: dict[str, Any]) -> Iterator[tuple[str, str]]:
+    """Yield (region_id, path_string) pairs from a geometry dict in a single pass.
+
+    String values are yielded as-is, list values are joined with spaces, and
+    non-string/non-list values (like _metadata) are skipped.
+    """
+    for key, value in geometry.items():
+        if isinstance(value, str):
+            # Already string format (shinymap format)
+            yield key, value
+        elif isinstance(value, list):
+            # List format (intermediate JSON) - join with space
+            yield key, " ".join(value)
+        # Skip non-string/non-list values (like _metadata dict)
+
+
 def _normalize_geometry_dict(geometry: dict[str, Any]) -> dict[str, str]:
     """Normalize geometry dict to string-valued format.
 
@@ -205,18 +226,7 @@ def _normalize_geometry_dict(geometry: dict[str, Any]) -> dict[str, str]:
         ... })
         {'region': 'M 0 0 L 100 0'}
     """
-    paths: dict[str, str] = {}
-
-    for key, value in geometry.items():
-        if isinstance(value, str):
-            # Already string format (shinymap format)
-            paths[key] = value
-        elif isinstance(value, list):
-            # List format (intermediate JSON) - join with space
-            paths[key] = " ".join(value)
-        # Skip non-string/non-list values (like _metadata dict)
-
-    return paths
+    return dict(_iter_geometry_paths(geometry))
 
 
 def calculate_viewbox(
@@ -297,10 +307,7 @@ def calculate_viewbox(
     else:
         # Custom bounds_fn provided - use it
         all_bounds = [bounds_fn(path_d) for path_d in paths.values()]
-        min_x = min(b[0] for b in all_bounds)
-        min_y = min(b[1] for b in all_bounds)
-        max_x = max(b[2] for b in all_bounds)
-        max_y = max(b[3] for b in all_bounds)
+        min_x, min_y, max_x, max_y = _union_bounds(all_bounds)
 
     width = max_x - min_x
     height = max_y - min_y
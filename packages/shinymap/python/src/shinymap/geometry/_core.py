@@ -75,6 +75,8 @@ from ._loader import load_geometry
 # - _find_complex_commands
 # - _compute_bounds_accurate
 # - _parse_svg_path_bounds
+# - _union_bounds
+# - _iter_geometry_paths
 # - _normalize_geometry_dict
 # These remain private to the geometry package.
 
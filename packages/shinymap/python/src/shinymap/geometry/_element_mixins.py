@@ -12,9 +12,13 @@ Key design decisions:
 
 from __future__ import annotations
 
+import reprlib
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from ._bounds import _parse_svg_path_bounds
+
 if TYPE_CHECKING:
     pass
 
@@ -86,8 +90,6 @@ class BoundsMixin:
         Uses existing _parse_svg_path_bounds for compatibility.
         Converts svg.py's PathData objects to string first.
         """
-        from shinymap.geometry._bounds import _parse_svg_path_bounds
-
         if self.d is None:  # type: ignore
             return (0.0, 0.0, 0.0, 0.0)
 
@@ -266,31 +268,40 @@ class JSONSerializableMixin:
         Raises:
             ValueError: If type is missing or unknown
         """
-        elem_type = data.get("type")
-        if not elem_type:
-            raise ValueError("Missing 'type' field in element dict")
-
         # Import here to avoid circular dependency
         from ._elements import ELEMENT_TYPE_MAP
 
-        element_cls = ELEMENT_TYPE_MAP.get(elem_type)
-        if not element_cls:
-            raise ValueError(f"Unknown element type: {elem_type}")
+        return _element_from_dict(data, ELEMENT_TYPE_MAP)
 
-        # Create a copy to avoid mutating input
-        attrs = dict(data)
-        attrs.pop("type")  # Remove type field
 
-        # Handle special conversions
-        if "class" in attrs:
-            # class → class_ (Python reserved word)
-            attrs["class_"] = attrs.pop("class").split()
+def _element_from_dict(data: dict[str, Any], type_map: Mapping[str, type]) -> Any:
+    """Build one element from its dict using an already-imported type map.
+
+    Batch loaders such as Geometry.from_dict() resolve ELEMENT_TYPE_MAP once and
+    call this per element instead of going through from_dict() each time.
+    """
+    elem_type = data.get("type")
+    if not elem_type:
+        raise ValueError("Missing 'type' field in element dict")
 
-        # For path elements, svg.py can accept string for d parameter
-        # It will be handled by svg.py's constructor
+    element_cls = type_map.get(elem_type)
+    if not element_cls:
+        raise ValueError(f"Unknown element type: {elem_type}")
 
-        # Create instance with attributes
-        return element_cls(**attrs)
+    # Create a copy to avoid mutating input
+    attrs = dict(data)
+    attrs.pop("type")  # Remove type field
+
+    # Handle special conversions
+    if "class" in attrs:
+        # class → class_ (Python reserved word)
+        attrs["class_"] = attrs.pop("class").split()
+
+    # For path elements, svg.py can accept string for d parameter
+    # It will be handled by svg.py's constructor
+
+    # Create instance with attributes
+    return element_cls(**attrs)
 
 
 @dataclass
@@ -329,8 +340,6 @@ class ShinymapElementMixin(BoundsMixin, JSONSerializableMixin):
             >>> str(circle)  # SVG markup from svg.py
             '<circle cx="100" cy="100" r="50" fill="#ff0000"/>'
         """
-        import reprlib
-
         class_name = self.__class__.__name__
         attrs = []
 
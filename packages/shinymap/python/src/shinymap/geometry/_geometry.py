@@ -2,19 +2,56 @@
 
 from __future__ import annotations
 
-import json
+import reprlib
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
+from itertools import chain, islice
 from pathlib import Path as PathType
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any
 
-from ._regions import Regions
+import orjson
+
+from ._bounds import _parse_svg_path_bounds, _union_bounds
+from ._regions import Regions, _content_key
+from ._repr_config import get_repr_config
 
 if TYPE_CHECKING:
     from ._elements import Element
 
-
-@dataclass
+# SVG attribute -> Element keyword argument for each supported shape, in extraction
+# order. Attributes needing more than a plain copy (path "d", polygon "points" and
+# text content) are handled inline in _from_svg_source().
+_SVG_SHAPE_ATTRS: dict[str, tuple[tuple[str, str], ...]] = {
+    tag: tuple((attr, attr.replace("-", "_")) for attr in attrs)
+    for tag, attrs in {
+        "circle": ("cx", "cy", "r", "fill", "stroke", "stroke-width"),
+        "rect": ("x", "y", "width", "height", "rx", "ry", "fill", "stroke", "stroke-width"),
+        "path": ("fill", "stroke", "stroke-width"),
+        "polygon": ("fill", "stroke", "stroke-width"),
+        "ellipse": ("cx", "cy", "rx", "ry", "fill", "stroke", "stroke-width"),
+        "line": ("x1", "y1", "x2", "y2", "stroke", "stroke-width"),
+        "text": (
+            "x",
+            "y",
+            "font-size",
+            "font-family",
+            "font-weight",
+            "font-style",
+            "text-anchor",
+            "dominant-baseline",
+            "fill",
+            "transform",
+        ),
+    }.items()
+}
+
+# Namespaced SVG tag -> shape name, built once so SVG extraction does not
+# re-format the qualified tag strings on every call
+_SVG_NS = "http://www.w3.org/2000/svg"
+_SVG_SHAPE_TAGS = {f"{{{_SVG_NS}}}{tag}": tag for tag in _SVG_SHAPE_ATTRS}
+
+
+@dataclass(slots=True)
 class Geometry:
     """Canonical geometry representation with polymorphic elements.
 
@@ -46,6 +83,11 @@ class Geometry:
 
     regions: Regions
     metadata: dict[str, Any] = field(default_factory=dict)
+    # (content key, elements kept alive for the key, union of element bounds) from the
+    # last viewbox() call that computed bounds; see _regions._content_key
+    _bounds_cache: (
+        tuple[tuple[Any, ...], list[Any], tuple[float, float, float, float] | None] | None
+    ) = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Convert regions to Regions object if needed."""
@@ -82,9 +124,11 @@ class Geometry:
             >>> Geometry.from_dict({"a": [{"type": "circle", "cx": 100, "cy": 100, "r": 50}]})
             Geometry(regions={'a': [Circle(cx=100, cy=100, r=50)]}, metadata={})
         """
-        from ._element_mixins import JSONSerializableMixin
+        from ._element_mixins import _element_from_dict
+        from ._elements import ELEMENT_TYPE_MAP
 
-        regions_dict: dict[str, list[str | Element]] = {}
+        # Fill a Regions directly so the constructor does not copy it again
+        regions_dict = Regions()
         metadata = {}
 
         for key, value in data.items():
@@ -95,8 +139,10 @@ class Geometry:
             elif isinstance(value, list):
                 # List format - check if elements are dicts (v1.x) or strings (v0.x)
                 if value and isinstance(value[0], dict):
-                    # v1.x format: list of element dicts - use generic from_dict
-                    elements = [JSONSerializableMixin.from_dict(elem_dict) for elem_dict in value]
+                    # v1.x format: list of element dicts, type map resolved once above
+                    elements = [
+                        _element_from_dict(elem_dict, ELEMENT_TYPE_MAP) for elem_dict in value
+                    ]
                     regions_dict[key] = elements
                 else:
                     # v0.x format: list of strings
@@ -105,7 +151,7 @@ class Geometry:
                 # v0.x format: single string path
                 regions_dict[key] = [value]
 
-        return cls(regions=Regions(regions_dict), metadata=metadata)
+        return cls(regions=regions_dict, metadata=metadata)
 
     @classmethod
     def from_json(cls, json_path: str | PathType) -> Geometry:
@@ -126,10 +172,10 @@ class Geometry:
         if not path.exists():
             raise FileNotFoundError(f"JSON file not found: {path}")
 
+        # Parse the raw bytes in one call rather than streaming a decoded text file
         try:
-            with open(path) as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            data = orjson.loads(path.read_bytes())
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Failed to parse JSON file: {e}") from e
 
         return cls.from_dict(data)
@@ -173,20 +219,40 @@ class Geometry:
             >>> geo.set_overlays(["_border"])
             >>> geo.to_json("output.json")
         """
-        from ._elements import Circle, Ellipse, Line, Path, Polygon, Rect, Text
-
         svg_path = PathType(svg_path).expanduser()
         if not svg_path.exists():
             raise FileNotFoundError(f"SVG file not found: {svg_path}")
 
+        return cls._from_svg_source(svg_path, extract_viewbox=extract_viewbox)
+
+    @classmethod
+    def _from_svg_source(
+        cls,
+        source: PathType | IO[bytes],
+        extract_viewbox: bool = True,
+    ) -> Geometry:
+        """Extract geometry from an SVG file path or binary file object.
+
+        Shared by from_svg() and callers that already hold the SVG bytes in memory
+        (e.g. the converter app), so the file does not need to be read twice.
+        """
+        from ._elements import ELEMENT_TYPE_MAP
+
+        # Parse with the C parser in one call (iterparse feeds the same parser from
+        # Python and is slower on large documents), then collect supported shapes in
+        # a single walk of the tree instead of one findall() per element type.
         try:
-            tree = ET.parse(svg_path)
-            root = tree.getroot()
+            root = ET.parse(source).getroot()
         except ET.ParseError as e:
             raise ValueError(f"Failed to parse SVG: {e}") from e
 
-        # SVG namespace handling
-        ns = {"svg": "http://www.w3.org/2000/svg"}
+        shapes: dict[str, list[ET.Element]] = {tag: [] for tag in _SVG_SHAPE_ATTRS}
+        # Dispatch on the namespaced tag with a single dict lookup per element
+        by_tag = {qualified: shapes[tag] for qualified, tag in _SVG_SHAPE_TAGS.items()}
+        for elem in root.iter():
+            found = by_tag.get(elem.tag)
+            if found is not None:
+                found.append(elem)
 
         # Extract viewBox from root SVG element
         viewbox = None
@@ -194,12 +260,12 @@ class Geometry:
             viewbox = root.get("viewBox")
 
         # Extract all supported shape elements
-        regions: dict[str, list[Element]] = {}
+        regions = Regions()
         auto_id_counters: dict[str, int] = {}
 
         # Helper to get or generate element ID
-        def get_element_id(elem: ET.Element, elem_type: str) -> str:
-            elem_id = elem.get("id")
+        def get_element_id(attrs: dict[str, str], elem_type: str) -> str:
+            elem_id = attrs.get("id")
             if elem_id:
                 return elem_id
             # Generate auto-ID: increment counter then use new value
@@ -208,38 +274,9 @@ class Geometry:
             auto_id_counters[elem_type] = counter
             return f"{elem_type}_{counter}"
 
-        # Extract circles
-        for circle_elem in root.findall(".//svg:circle", ns):
-            elem_id = get_element_id(circle_elem, "circle")
-            circle = Circle(
-                cx=circle_elem.get("cx"),  # type: ignore[arg-type]
-                cy=circle_elem.get("cy"),  # type: ignore[arg-type]
-                r=circle_elem.get("r"),  # type: ignore[arg-type]
-                fill=circle_elem.get("fill"),
-                stroke=circle_elem.get("stroke"),
-                stroke_width=circle_elem.get("stroke-width"),  # type: ignore[arg-type]
-            )
-            regions[elem_id] = [circle]
-
-        # Extract rectangles
-        for rect_elem in root.findall(".//svg:rect", ns):
-            elem_id = get_element_id(rect_elem, "rect")
-            # NOTE: svg.py accepts string attributes at runtime but type annotations expect numbers
-            # This is a known limitation of svg.py's type annotations
-            rect = Rect(
-                x=rect_elem.get("x"),  # type: ignore[arg-type]
-                y=rect_elem.get("y"),  # type: ignore[arg-type]
-                width=rect_elem.get("width"),  # type: ignore[arg-type]
-                height=rect_elem.get("height"),  # type: ignore[arg-type]
-                rx=rect_elem.get("rx"),  # type: ignore[arg-type]
-                ry=rect_elem.get("ry"),  # type: ignore[arg-type]
-                fill=rect_elem.get("fill"),
-                stroke=rect_elem.get("stroke"),
-                stroke_width=rect_elem.get("stroke-width"),  # type: ignore[arg-type]
-            )
-            regions[elem_id] = [rect]
-
-        # Extract paths
+        # Build one Element per extracted shape, type by type in _SVG_SHAPE_ATTRS order.
+        # NOTE: svg.py accepts string attributes at runtime but type annotations expect
+        # numbers; this is a known limitation of svg.py's type annotations.
         # TODO: Detect paths that are semantically lines, not filled shapes.
         # Detection heuristics:
         # 1. fill="none" indicates stroke-only rendering
@@ -247,93 +284,43 @@ class Geometry:
         # Open paths without fill are typically lines (grid lines, dividers, borders).
         # Consider converting such paths to Line elements or marking them for
         # automatic stroke-only aesthetic handling.
-        for path_elem in root.findall(".//svg:path[@d]", ns):
-            path_d = path_elem.get("d")
-            if not path_d:
+        for tag, attr_kwargs in _SVG_SHAPE_ATTRS.items():
+            found = shapes[tag]
+            if not found:
+                # Resolve constructors only for shapes the document actually contains
                 continue
-            elem_id = get_element_id(path_elem, "path")
-            path = Path(
-                d=path_d.strip(),  # type: ignore[arg-type]
-                fill=path_elem.get("fill"),
-                stroke=path_elem.get("stroke"),
-                stroke_width=path_elem.get("stroke-width"),  # type: ignore[arg-type]
-            )
-            regions[elem_id] = [path]
-
-        # Extract polygons
-        for polygon_elem in root.findall(".//svg:polygon", ns):
-            points_str = polygon_elem.get("points")
-            if not points_str:
-                continue
-            elem_id = get_element_id(polygon_elem, "polygon")
-            # Convert points string to list of numbers
-            points = [float(p) for p in points_str.replace(",", " ").split()]
-            polygon = Polygon(
-                points=points,  # type: ignore[arg-type]
-                fill=polygon_elem.get("fill"),
-                stroke=polygon_elem.get("stroke"),
-                stroke_width=polygon_elem.get("stroke-width"),  # type: ignore[arg-type]
-            )
-            regions[elem_id] = [polygon]
-
-        # Extract ellipses
-        for ellipse_elem in root.findall(".//svg:ellipse", ns):
-            elem_id = get_element_id(ellipse_elem, "ellipse")
-            ellipse = Ellipse(
-                cx=ellipse_elem.get("cx"),  # type: ignore[arg-type]
-                cy=ellipse_elem.get("cy"),  # type: ignore[arg-type]
-                rx=ellipse_elem.get("rx"),  # type: ignore[arg-type]
-                ry=ellipse_elem.get("ry"),  # type: ignore[arg-type]
-                fill=ellipse_elem.get("fill"),
-                stroke=ellipse_elem.get("stroke"),
-                stroke_width=ellipse_elem.get("stroke-width"),  # type: ignore[arg-type]
-            )
-            regions[elem_id] = [ellipse]
-
-        # Extract lines
-        for line_elem in root.findall(".//svg:line", ns):
-            elem_id = get_element_id(line_elem, "line")
-            line = Line(
-                x1=line_elem.get("x1"),  # type: ignore[arg-type]
-                y1=line_elem.get("y1"),  # type: ignore[arg-type]
-                x2=line_elem.get("x2"),  # type: ignore[arg-type]
-                y2=line_elem.get("y2"),  # type: ignore[arg-type]
-                stroke=line_elem.get("stroke"),
-                stroke_width=line_elem.get("stroke-width"),  # type: ignore[arg-type]
-            )
-            regions[elem_id] = [line]
-
-        # Extract text elements
-        for text_elem in root.findall(".//svg:text", ns):
-            elem_id = get_element_id(text_elem, "text")
-            # Get text content (may be in text attribute or as element text)
-            text_content = text_elem.text or ""
-            text = Text(
-                x=text_elem.get("x"),  # type: ignore[arg-type]
-                y=text_elem.get("y"),  # type: ignore[arg-type]
-                text=text_content.strip() if text_content else None,
-                font_size=text_elem.get("font-size"),  # type: ignore[arg-type]
-                font_family=text_elem.get("font-family"),
-                font_weight=text_elem.get("font-weight"),  # type: ignore[arg-type]
-                font_style=text_elem.get("font-style"),  # type: ignore[arg-type]
-                text_anchor=text_elem.get("text-anchor"),  # type: ignore[arg-type]
-                dominant_baseline=text_elem.get("dominant-baseline"),  # type: ignore[arg-type]
-                fill=text_elem.get("fill"),
-                transform=text_elem.get("transform"),  # type: ignore[arg-type]
-            )
-            regions[elem_id] = [text]
+            element_cls = ELEMENT_TYPE_MAP[tag]
+            for elem in found:
+                attrs = elem.attrib
+                kwargs: dict[str, Any] = {kw: attrs.get(attr) for attr, kw in attr_kwargs}
+                if tag == "path":
+                    path_d = attrs.get("d")
+                    if not path_d:
+                        continue
+                    kwargs["d"] = path_d.strip()
+                elif tag == "polygon":
+                    points_str = attrs.get("points")
+                    if not points_str:
+                        continue
+                    # Convert points string to list of numbers
+                    kwargs["points"] = [float(p) for p in points_str.replace(",", " ").split()]
+                elif tag == "text":
+                    kwargs["text"] = elem.text.strip() if elem.text else None
+                regions[get_element_id(attrs, tag)] = [element_cls(**kwargs)]
 
         # Build metadata
         metadata: dict[str, Any] = {}
         if viewbox:
             metadata["viewBox"] = viewbox
 
-        return cls(regions=Regions(regions), metadata=metadata)  # type: ignore[arg-type]
+        return cls(regions=regions, metadata=metadata)
 
     def viewbox(self, padding: float = 0.02) -> tuple[float, float, float, float]:
         """Get viewBox from metadata, or compute from geometry coordinates.
 
         Works with both v0.x (string paths) and v1.x (Element objects).
+        The element bounds are reused across calls while the regions hold the same
+        elements; replacing, adding or removing regions or elements recomputes them.
 
         Args:
             padding: Padding fraction for computed viewBox (default 2%)
@@ -354,31 +341,15 @@ class Geometry:
                 raise ValueError(f"Invalid viewBox format: {vb_str}")
             return (float(parts[0]), float(parts[1]), float(parts[2]), float(parts[3]))
 
-        # Compute from geometry
-        # Collect all bounds from all elements
-        all_bounds: list[tuple[float, float, float, float]] = []
-
-        for elements in self.regions.values():
-            for elem in elements:
-                if isinstance(elem, str):
-                    # v0.x format: parse path string
-                    from ._bounds import _parse_svg_path_bounds
-
-                    bounds = _parse_svg_path_bounds(elem)
-                    all_bounds.append(bounds)
-                else:
-                    # v1.x format: use element's bounds() method
-                    bounds = elem.bounds()
-                    all_bounds.append(bounds)
-
-        if not all_bounds:
+        key, elements = _content_key(self.regions)
+        if self._bounds_cache is None or self._bounds_cache[0] != key:
+            self._bounds_cache = (key, elements, self._union_element_bounds())
+        bounds = self._bounds_cache[2]
+        if bounds is None:
             return (0.0, 0.0, 100.0, 100.0)
 
         # Compute overall bounding box
-        min_x = min(b[0] for b in all_bounds)
-        min_y = min(b[1] for b in all_bounds)
-        max_x = max(b[2] for b in all_bounds)
-        max_y = max(b[3] for b in all_bounds)
+        min_x, min_y, max_x, max_y = bounds
 
         width = max_x - min_x
         height = max_y - min_y
@@ -394,6 +365,28 @@ class Geometry:
 
         return (min_x, min_y, width, height)
 
+    def _union_element_bounds(self) -> tuple[float, float, float, float] | None:
+        """Compute (min_x, min_y, max_x, max_y) over all elements, or None if empty."""
+        # Split v0.x path strings from v1.x Element objects once, then collect
+        # bounds with one straight loop per kind (order is irrelevant to the union)
+        path_strings: list[str] = []
+        shape_elements: list[Element] = []
+        for elements in self.regions.values():
+            for elem in elements:
+                if isinstance(elem, str):
+                    path_strings.append(elem)
+                else:
+                    shape_elements.append(elem)
+
+        all_bounds: list[tuple[float, float, float, float]] = list(
+            map(_parse_svg_path_bounds, path_strings)
+        )
+        all_bounds.extend(elem.bounds() for elem in shape_elements)
+
+        if not all_bounds:
+            return None
+        return _union_bounds(all_bounds)
+
     def overlays(self) -> list[str]:
         """Get overlay region IDs from metadata.
 
@@ -412,6 +405,11 @@ class Geometry:
         overlays = self.metadata.get("overlays", [])
         return list(overlays) if isinstance(overlays, list) else []
 
+    def _overlay_id_set(self) -> frozenset[str]:
+        """Overlay IDs as a set, read straight from metadata without a list copy."""
+        overlays = self.metadata.get("overlays")
+        return frozenset(overlays) if isinstance(overlays, list) else frozenset()
+
     def main_regions(self) -> Regions:
         """Get main regions (excluding overlays).
 
@@ -428,8 +426,11 @@ class Geometry:
             >>> geo.main_regions()
             Regions({'region': ['M 0 0']})
         """
-        overlay_ids = set(self.overlays())
-        return Regions({k: v for k, v in self.regions.items() if k not in overlay_ids})
+        overlay_ids = self._overlay_id_set()
+        if not overlay_ids:
+            # Nothing to exclude: a C-level dict copy beats a filtered scan
+            return Regions(self.regions)
+        return Regions((k, v) for k, v in self.regions.items() if k not in overlay_ids)
 
     def overlay_regions(self) -> Regions:
         """Get overlay regions only.
@@ -447,8 +448,10 @@ class Geometry:
             >>> geo.overlay_regions()
             Regions({'_border': ['M 0 0 L 100 0']})
         """
-        overlay_ids = set(self.overlays())
-        return Regions({k: v for k, v in self.regions.items() if k in overlay_ids})
+        overlay_ids = self._overlay_id_set()
+        if not overlay_ids:
+            return Regions()
+        return Regions((k, v) for k, v in self.regions.items() if k in overlay_ids)
 
     def relabel(self, mapping: dict[str, str | list[str]]) -> Geometry:
         """Rename or merge regions (returns new Geometry object).
@@ -481,32 +484,38 @@ class Geometry:
             >>> geo2.regions.keys()
             dict_keys(['region_a', '_border'])
         """
-        new_regions: dict[str, list[str]] = {}
-        relabeled_ids: set[str] = set()
-
-        # Apply relabeling
-        for new_id, old_id_or_ids in mapping.items():
-            # Normalize to list for uniform processing
-            old_ids = [old_id_or_ids] if isinstance(old_id_or_ids, str) else old_id_or_ids
-
-            # Collect all paths (flatten nested lists from multiple regions)
-            path_parts = []
+        # Normalize each value to a list of old IDs and validate them up front
+        old_ids_by_new = {
+            new_id: [old] if isinstance(old, str) else old for new_id, old in mapping.items()
+        }
+        relabeled_ids = {old_id for old_ids in old_ids_by_new.values() for old_id in old_ids}
+        for old_ids in old_ids_by_new.values():
             for old_id in old_ids:
                 if old_id not in self.regions:
                     raise ValueError(f"Path '{old_id}' not found in geometry")
-                # Extend to flatten: self.regions[old_id] is already a list
-                path_parts.extend(self.regions[old_id])
-                relabeled_ids.add(old_id)
-
-            # Store as list (single region = single-element, merge = multi-element)
-            new_regions[new_id] = path_parts  # type: ignore[assignment]
 
-        # Keep regions that weren't relabeled
-        for region_id, paths in self.regions.items():
-            if region_id not in relabeled_ids:
-                new_regions[region_id] = paths  # type: ignore[assignment]
-
-        return Geometry(regions=Regions(new_regions), metadata=dict(self.metadata))  # type: ignore[arg-type]
+        # Relabeled regions (single region = rename, several = merge), then the rest
+        regions = self.regions
+        new_regions = Regions(
+            (new_id, list(chain.from_iterable(regions[old_id] for old_id in old_ids)))
+            for new_id, old_ids in old_ids_by_new.items()
+        )
+        new_regions.update(
+            (region_id, paths)
+            for region_id, paths in regions.items()
+            if region_id not in relabeled_ids
+        )
+
+        return Geometry(regions=new_regions, metadata=dict(self.metadata))
+
+    def _with_metadata(self, metadata: dict[str, Any]) -> Geometry:
+        """Return a new Geometry with a shallow copy of these regions.
+
+        Metadata-only transformations never touch regions, so only the mapping is
+        copied; the element lists and objects are shared, which also lets the
+        derived geometry reuse the serialized payload cached for the original.
+        """
+        return Geometry(regions=Regions(self.regions), metadata=metadata)
 
     def set_overlays(self, overlay_ids: list[str]) -> Geometry:
         """Set overlay region IDs in metadata (returns new Geometry object).
@@ -528,7 +537,7 @@ class Geometry:
         """
         new_metadata = dict(self.metadata)
         new_metadata["overlays"] = overlay_ids
-        return Geometry(regions=Regions(dict(self.regions)), metadata=new_metadata)
+        return self._with_metadata(new_metadata)
 
     def update_metadata(self, metadata: dict[str, Any]) -> Geometry:
         """Update metadata (returns new Geometry object).
@@ -552,7 +561,7 @@ class Geometry:
             'Wikimedia Commons'
         """
         new_metadata = {**self.metadata, **metadata}
-        return Geometry(regions=Regions(dict(self.regions)), metadata=new_metadata)
+        return self._with_metadata(new_metadata)
 
     def path_as_line(self, *region_ids: str) -> Geometry:
         """Mark regions as lines described in path notation.
@@ -575,16 +584,12 @@ class Geometry:
             >>> geo2 = geo.path_as_line("_divider")
             >>> # Now _divider will use stroke-only rendering
         """
-        # Get existing list or create new one
-        existing = list(self.metadata.get("lines_as_path", []))
+        # Append new region IDs to the existing list, dropping duplicates in order
+        existing = self.metadata.get("lines_as_path", [])
+        lines_as_path = list(dict.fromkeys([*existing, *region_ids]))
 
-        # Add new region IDs (avoid duplicates)
-        for region_id in region_ids:
-            if region_id not in existing:
-                existing.append(region_id)
-
-        new_metadata = {**self.metadata, "lines_as_path": existing}
-        return Geometry(regions=Regions(dict(self.regions)), metadata=new_metadata)
+        new_metadata = {**self.metadata, "lines_as_path": lines_as_path}
+        return self._with_metadata(new_metadata)
 
     def to_dict(self) -> dict[str, Any]:
         """Export to dict in shinymap JSON format.
@@ -612,23 +617,24 @@ class Geometry:
         if self.metadata:
             output["_metadata"] = dict(self.metadata)
 
-        # Serialize regions: keep strings as-is, serialize Element objects
-        for region_id, elements in self.regions.items():
-            serialized_elements = []
-            for elem in elements:
-                if isinstance(elem, str):
-                    # v0.x format: keep string as-is
-                    serialized_elements.append(elem)
-                else:
-                    # v1.x format: serialize Element to dict
-                    serialized_elements.append(elem.to_dict())  # type: ignore[arg-type]
-            output[region_id] = serialized_elements
+        # Serialize regions: keep v0.x strings as-is, v1.x Element objects via to_dict()
+        output.update(
+            (
+                region_id,
+                [elem if isinstance(elem, str) else elem.to_dict() for elem in elements],
+            )
+            for region_id, elements in self.regions.items()
+        )
 
         return output
 
     def to_json(self, output_path: str | PathType) -> None:
         """Write geometry to JSON file.
 
+        Written with orjson as UTF-8 with 2-space indentation. Number formatting follows
+        orjson (e.g. 0.00001 and 1.5e-7), NaN/Infinity are written as null, and integers
+        wider than 64 bits raise orjson.JSONEncodeError.
+
         Args:
             output_path: Path to write JSON file
 
@@ -638,8 +644,7 @@ class Geometry:
         """
         output_path = PathType(output_path).expanduser()
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        output_path.write_bytes(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
 
     def __repr__(self) -> str:
         """Return clean repr showing regions summary and metadata.
@@ -653,10 +658,6 @@ class Geometry:
             >>> geo
             Geometry(regions={47 regions}, metadata={'viewBox': '0 0 1000 1000'})
         """
-        import reprlib
-
-        from ._repr_config import get_repr_config
-
         config = get_repr_config()
 
         r = reprlib.Repr()
@@ -666,14 +667,12 @@ class Geometry:
         region_count = len(self.regions)
         show_threshold = max(3, config.max_regions // 2)
         if region_count <= show_threshold:
-            region_keys = list(self.regions.keys())
-            regions_repr = f"{{{', '.join(repr(k) for k in region_keys)}}}"
+            regions_repr = f"{{{', '.join(map(repr, self.regions))}}}"
         else:
             preview_count = max(2, show_threshold // 2)
-            region_keys = list(self.regions.keys())[:preview_count]
-            regions_repr = (
-                f"{{{', '.join(repr(k) for k in region_keys)}, ... ({region_count} regions)}}"
-            )
+            # Take just the preview keys instead of listing every region first
+            preview = ", ".join(map(repr, islice(self.regions, preview_count)))
+            regions_repr = f"{{{preview}, ... ({region_count} regions)}}"
 
         # Use reprlib for metadata
         metadata_repr = r.repr(self.metadata)
@@ -19,7 +19,7 @@ import warnings
 from pathlib import Path
 from typing import Any
 
-from ._bounds import BoundsCalculator, _normalize_geometry_dict, calculate_viewbox
+from ._bounds import BoundsCalculator, _iter_geometry_paths, calculate_viewbox
 
 
 def load_geometry(
@@ -123,14 +123,11 @@ def load_geometry(
         if isinstance(meta_overlays, list):
             overlay_key_set = set(meta_overlays)
 
-    # Normalize all geometry (both main and overlays) using shared function
-    all_geometry = _normalize_geometry_dict(data)
-
-    # Separate geometry and overlays based on overlay_key_set
+    # Normalize and separate geometry and overlays in a single pass
     geometry: dict[str, str] = {}
     overlay_geometry: dict[str, str] = {}
 
-    for key, path_str in all_geometry.items():
+    for key, path_str in _iter_geometry_paths(data):
         if key in overlay_key_set:
             overlay_geometry[key] = path_str
         else:
@@ -2,12 +2,32 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import reprlib
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+from ._repr_config import get_repr_config
 
 if TYPE_CHECKING:
     from ._elements import Element
 
 
+def _content_key(regions: Mapping[str, Any]) -> tuple[tuple[Any, ...], list[Any]]:
+    """Key identifying the regions by their IDs and element objects, plus those elements.
+
+    The key pairs each region ID with the id() of its elements. Callers caching on it
+    must keep the returned elements alive so their ids cannot be reused meanwhile.
+    Attribute edits on an existing element object do not change the key.
+    """
+    elements: list[Any] = []
+    key_parts: list[tuple[Any, ...]] = []
+    for region_id, value in regions.items():
+        items = value if isinstance(value, list) else [value]
+        elements.extend(items)
+        key_parts.append((region_id, *map(id, items)))
+    return tuple(key_parts), elements
+
+
 class Regions(dict[str, list["str | Element"]]):
     """Dictionary subclass with clean repr for region data.
 
@@ -30,22 +50,19 @@ class Regions(dict[str, list["str | Element"]]):
         Truncates long lists and shows counts for large dictionaries.
         Uses global repr configuration from get_repr_config().
         """
-        import reprlib
-
-        from ._repr_config import get_repr_config
-
         if not self:
             return "Regions({})"
 
         config = get_repr_config()
+        # One Repr per call, shared by all entries
+        r = reprlib.Repr()
+        r.maxlist = config.max_elements
 
         # For small dictionaries, show all entries
         if len(self) <= config.max_regions:
             lines = ["Regions({"]
             for key, value in self.items():
                 # Use reprlib for value to keep it concise
-                r = reprlib.Repr()
-                r.maxlist = config.max_elements
                 val_repr = r.repr(value)
                 lines.append(f"  {key!r}: {val_repr},")
             lines.append("})")
@@ -57,8 +74,6 @@ class Regions(dict[str, list["str | Element"]]):
             for i, (key, value) in enumerate(self.items()):
                 if i >= show_count:
                     break
-                r = reprlib.Repr()
-                r.maxlist = config.max_elements
                 val_repr = r.repr(value)
                 lines.append(f"  {key!r}: {val_repr},")
             remaining = len(self) - show_count
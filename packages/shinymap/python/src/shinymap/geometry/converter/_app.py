@@ -1,18 +1,23 @@
 from __future__ import annotations
 
-import json
-import tempfile
 from pathlib import Path
+from typing import Any
 
+import orjson
 from shiny import App, reactive, render, ui
 
-from ..._ui import Map, input_map, output_map, render_map, update_map
-from .._core import Geometry, convert, infer_relabel
-from ._tool import generate_code, load_file
+from ... import aes
+from ..._ui import Map, output_map, render_map, update_map
+from ..._wash import wash
+from .._core import Geometry
+from ._tool import cached_infer_relabel, generate_code, load_file
 
 # Module-level variable for CLI-provided SVG/JSON file
 _initial_file: Path | None
 
+# Longest JSON text sent to the preview pane; the download has the full output
+_PREVIEW_MAX_CHARS = 200_000
+
 ## Upload File =====================================================================
 
 panel_upload = ui.nav_panel(
@@ -23,8 +28,9 @@ panel_upload = ui.nav_panel(
             ui.output_ui("upload_file"),
             output_map("output_path_file"),
             ui.output_text("path_file_name"),
-            ui.input_text("meta_source", "Source"),
-            ui.input_text("meta_license", "License"),
+            # Commit metadata on blur/Enter so typing does not re-run the conversion
+            ui.input_text("meta_source", "Source", update_on="blur"),
+            ui.input_text("meta_license", "License", update_on="blur"),
         ),
         ui.TagList(
             ui.help_text("Path IDs"),
@@ -34,15 +40,24 @@ panel_upload = ui.nav_panel(
     ),
 )
 
+# Static fragments returned from render.ui; built once rather than per render
+_path_file_input = ui.input_file(
+    "path_file",
+    "Choose SVG or JSON file",
+    accept=[".svg", ".json"],
+    multiple=False,
+)
+_invalid_data = ui.p("Invalid data")
+
 
 def server_file_upload(input, file_name, extracted_data):
     @render_map
     def output_path_file():
         if _initial_file is not None:
-            result = convert(_initial_file)
-            # Result is the final JSON - create Geometry object from it
-            geo = Geometry.from_dict(result)
-            return Map(geo)
+            # Reuse the Geometry parsed at startup instead of re-reading the file
+            data = extracted_data()
+            if data and "geometry" in data:
+                return Map(data["geometry"])
         # Return empty map when no file loaded
         empty_geo = Geometry.from_dict({"_metadata": {"viewBox": "0 0 100 100"}})
         return Map(empty_geo)
@@ -50,12 +65,7 @@ def server_file_upload(input, file_name, extracted_data):
     @render.ui
     def upload_file():
         if _initial_file is None:
-            return ui.input_file(
-                "path_file",
-                "Choose SVG or JSON file",
-                accept=[".svg", ".json"],
-                multiple=False,
-            )
+            return _path_file_input
 
     @reactive.effect
     @reactive.event(input.path_file)
@@ -119,48 +129,45 @@ panel_relabeling = ui.nav_panel(
 )
 
 
+# Relabeling map styling: slate stroke, bold stroke when selected, yellow hover wash
+_relabel_wash = wash(
+    shape=aes.ByState(
+        aes.Shape(stroke_color="#64748b", stroke_width=1),
+        select=aes.Shape(stroke_color="#11203b", stroke_width=5),
+        hover=aes.Shape(fill_color="#fef08a", fill_opacity=0.6, stroke_width=0),
+    )
+)
+
+
+def _relabeling_map(geo: Geometry, registered: set[str]):
+    """Relabeling input map with each region filled by its R (registered) state."""
+    # Registered -> slate-50 (white-ish, done), not registered -> slate-300 (needs attention)
+    fills = aes.ByGroup(
+        **{
+            region_id: aes.Shape(fill_color="#f8fafc" if region_id in registered else "#cbd5e1")
+            for region_id in geo.regions
+        }
+    )
+    return _relabel_wash.input_map("relabeling", geo, mode="multiple", aes=fills)
+
+
 def server_relabeling(input, extracted_data, relabel_rules, registered_ids, overlay_ids):
     @render.ui
     def map_relabeling():
         """Preview the extracted geometry with state-based styling."""
         data = extracted_data()
         if not data or "error" in data:
-            return ui.p("Invalid data")
+            return _invalid_data
 
         # Get Geometry object from loaded data
         geo = data.get("geometry")
         if not geo:
-            return ui.p("Invalid data")
+            return _invalid_data
 
         if not geo.regions:
-            return ui.p("Invalid data")
+            return _invalid_data
 
-        # Get current R (registered) state
-        current_registered = registered_ids()
-
-        # Build fill_color map based on R state
-        # Registered -> white-ish (done), Not registered -> gray-ish (needs attention)
-        fill_colors = {}
-        for region_id in geo.regions.keys():
-            is_registered = region_id in current_registered
-            if is_registered:
-                fill_colors[region_id] = "#f8fafc"  # slate-50 (white-ish, registered)
-            else:
-                fill_colors[region_id] = "#cbd5e1"  # slate-300 (gray-ish, not registered)
-
-        return input_map(
-            "relabeling",
-            geo,
-            mode="multiple",
-            fill_color=fill_colors,
-            default_aesthetic={"stroke_color": "#64748b", "stroke_width": 1},
-            selected_aesthetic={"stroke_color": "#11203b", "stroke_width": 5},
-            hover_highlight={
-                "fill_color": "#fef08a",
-                "fill_opacity": 0.6,
-                "stroke_width": 0,
-            },
-        )
+        return _relabeling_map(geo, registered_ids())
 
     @render.text
     def selected_original_ids():
@@ -383,14 +390,7 @@ def server(input, output, session):
             msg += f" ({auto_generated} auto-generated IDs)"
         msg += ":\n\n"
 
-        return msg + "\n".join(f"  • {pid}" for pid in path_ids)
-
-    def parse_json_input(text: str, default):
-        """Parse JSON input, return default on error."""
-        try:
-            return json.loads(text)
-        except (json.JSONDecodeError, ValueError):
-            return default
+        return msg + "\n".join(map("  • {}".format, path_ids))
 
     @reactive.calc
     def get_conversion_params():
@@ -429,6 +429,9 @@ def server(input, output, session):
             return None
         return data.get("geometry")
 
+    # Inputs and result of the last transformation applied by get_final_json
+    final_json_memo: dict[str, Any] = {}
+
     @reactive.calc
     def get_final_json():
         """Generate the final JSON output by applying transformations."""
@@ -436,9 +439,15 @@ def server(input, output, session):
         if not params:
             return None
 
+        # Skip the pipeline when only unrelated inputs (e.g. output_filename) changed
+        source = params["geometry"]
+        options = (params["relabel"], params["overlay_ids"], params["metadata"])
+        if final_json_memo.get("source") is source and final_json_memo.get("options") == options:
+            return final_json_memo["result"]
+
         try:
             # Apply transformations using Geometry methods
-            geo = params["geometry"]
+            geo = source
 
             # Apply relabeling if specified
             if params["relabel"]:
@@ -452,9 +461,12 @@ def server(input, output, session):
             if params["metadata"]:
                 geo = geo.update_metadata(params["metadata"])
 
-            return geo.to_dict()
+            result = geo.to_dict()
         except Exception as e:
-            return {"error": str(e)}
+            result = {"error": str(e)}
+
+        final_json_memo.update(source=source, options=options, result=result)
+        return result
 
     @render.text
     def json_preview():
@@ -466,22 +478,36 @@ def server(input, output, session):
         if "error" in result:
             return f"Error: {result['error']}"
 
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        text = orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+        if len(text) > _PREVIEW_MAX_CHARS:
+            hidden = len(text) - _PREVIEW_MAX_CHARS
+            text = (
+                f"{text[:_PREVIEW_MAX_CHARS]}\n"
+                f"... ({hidden} more characters truncated in preview; download for full output)"
+            )
+        return text
 
-    @render.text
-    def code_preview():
-        """Preview the generated Python code."""
+    @reactive.calc
+    def get_code():
+        """Generate the conversion code once for preview and download."""
         params = get_conversion_params()
         if not params:
-            return "Upload SVG to preview Python code."
+            return None
 
-        code = generate_code(
+        return generate_code(
             params["input_filename"],
             params["output_filename"],
             params["relabel"],
             params["overlay_ids"],
             params["metadata"],
         )
+
+    @render.text
+    def code_preview():
+        """Preview the generated Python code."""
+        code = get_code()
+        if code is None:
+            return "Upload SVG to preview Python code."
         return code
 
     @render.download(filename=lambda: input.output_filename())
@@ -489,46 +515,33 @@ def server(input, output, session):
         """Download the final JSON file."""
         result = get_final_json()
         if not result or "error" in result:
-            return ""
+            return
 
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
-            return f.name
+        # Stream serialized bytes directly to the client
+        yield orjson.dumps(result, option=orjson.OPT_INDENT_2)
 
     @render.download(filename=lambda: input.output_filename().replace(".json", ".py"))
     def download_code():
         """Download the generated Python code."""
-        params = get_conversion_params()
-        if not params:
-            return ""
-
-        code = generate_code(
-            params["input_filename"],
-            params["output_filename"],
-            params["relabel"],
-            params["overlay_ids"],
-            params["metadata"],
-        )
+        code = get_code()
+        if code is None:
+            return
 
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(code)
-            return f.name
+        yield code.encode()
 
     @render.text
     def inferred_code():
         """Infer code from original source file."""
+        # Get conversion params for metadata and overlay_ids (no file, no JSON to build)
+        params = get_conversion_params()
+        if not params:
+            return "Upload a file first."
+
         # Get final JSON
         final = get_final_json()
         if not final or "error" in final:
             return "Generate final JSON first (configure transformations in other tabs)."
 
-        # Get conversion params for metadata and overlay_ids
-        params = get_conversion_params()
-        if not params:
-            return "Upload a file first."
-
         # Determine original file
         original_file_info = input.original_file()
         if original_file_info:
@@ -543,9 +556,9 @@ def server(input, output, session):
             original_path = data["file_path"]
             original_filename = data["original_source"]
 
-        # Infer relabel mapping
+        # Infer relabel mapping (cached by original and final content)
         try:
-            inferred_relabel = infer_relabel(original_path, final)
+            inferred_relabel = cached_infer_relabel(original_path, final)
         except Exception as e:
             return f"Error inferring transformations: {e}"
 
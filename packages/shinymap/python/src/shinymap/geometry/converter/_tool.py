@@ -1,6 +1,21 @@
+import hashlib
+import io
+from collections import OrderedDict
 from pathlib import Path
 
-from .._core import Geometry
+import orjson
+
+from .._core import Geometry, infer_relabel
+
+# Parsed geometries keyed by file content digest (re-uploads skip parsing)
+_LOAD_CACHE_SIZE = 8
+_load_cache: OrderedDict[tuple[int, bytes, bool], Geometry] = OrderedDict()
+
+# Inferred relabel mappings keyed by (original digest, suffix, final JSON digest)
+_INFER_CACHE_SIZE = 16
+_infer_cache: OrderedDict[tuple[bytes, str, bytes], dict[str, str | list[str]] | None] = (
+    OrderedDict()
+)
 
 
 def generate_code(
@@ -41,6 +56,60 @@ def generate_code(
     return "\n".join(lines)
 
 
+def _load_geometry(path: Path, is_json: bool) -> Geometry:
+    """Parse SVG or JSON file, reusing the result for identical file contents.
+
+    Uploaded files get a fresh temporary path every time, so the cache is keyed
+    on (size, digest, file type) rather than on the path.
+    """
+    content = path.read_bytes()
+    key = (len(content), hashlib.blake2b(content, digest_size=16).digest(), is_json)
+
+    geo = _load_cache.get(key)
+    if geo is not None:
+        _load_cache.move_to_end(key)
+        return geo
+
+    # Parse from the bytes already read for hashing instead of re-reading the file
+    if is_json:
+        try:
+            geo = Geometry.from_dict(orjson.loads(content))
+        except orjson.JSONDecodeError as e:
+            raise ValueError(f"Failed to parse JSON file: {e}") from e
+    else:
+        geo = Geometry._from_svg_source(io.BytesIO(content), extract_viewbox=True)
+
+    _load_cache[key] = geo
+    if len(_load_cache) > _LOAD_CACHE_SIZE:
+        _load_cache.popitem(last=False)
+    return geo
+
+
+def cached_infer_relabel(original_path: str, final: dict) -> dict[str, str | list[str]] | None:
+    """Run infer_relabel, reusing the result for identical original and final content.
+
+    Revisiting the inference tab or editing unrelated inputs would otherwise
+    re-parse the original file and re-match every path.
+    """
+    path = Path(original_path)
+    key = (
+        hashlib.blake2b(path.read_bytes(), digest_size=16).digest(),
+        path.suffix.lower(),
+        hashlib.blake2b(orjson.dumps(final, option=orjson.OPT_SORT_KEYS), digest_size=16).digest(),
+    )
+
+    if key in _infer_cache:
+        _infer_cache.move_to_end(key)
+        return _infer_cache[key]
+
+    relabel = infer_relabel(path, final)
+
+    _infer_cache[key] = relabel
+    if len(_infer_cache) > _INFER_CACHE_SIZE:
+        _infer_cache.popitem(last=False)
+    return relabel
+
+
 def load_file(file_path: str, filename: str):
     """Load SVG or JSON file and return Geometry object with metadata."""
 
@@ -48,14 +117,12 @@ def load_file(file_path: str, filename: str):
     path = Path(file_path)
     is_json = path.suffix.lower() == ".json"
 
-    # Load geometry based on file type
+    # Load geometry based on file type (cached by file content)
+    geo = _load_geometry(path, is_json)
     if is_json:
-        geo = Geometry.from_json(file_path)
         # Try to get original source from metadata
         original_source = geo.metadata.get("original_source", filename)
     else:
-        # SVG file
-        geo = Geometry.from_svg(file_path, extract_viewbox=True)
         original_source = filename
 
     # Extract path IDs for display
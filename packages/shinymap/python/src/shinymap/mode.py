@@ -44,15 +44,44 @@ Usage:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any
 
-if TYPE_CHECKING:
-    from ._aesthetics import ByGroup, IndexedAesthetic
+import orjson
 
+from ._aesthetics import ByGroup, IndexedAesthetic
 
-@dataclass
-class Single:
+
+class _ModeJSONMixin:
+    """Shared serialization for mode classes (each declares _dict_cache and _json_cache).
+
+    Mode classes freeze their containers on construction (selected becomes a tuple,
+    values a read-only copy), so both caches stay valid for the life of the instance.
+    """
+
+    __slots__ = ()
+
+    def _build_dict(self) -> dict[str, Any]:
+        raise NotImplementedError
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JavaScript (built once per instance; returns a shallow copy)."""
+        if self._dict_cache is None:  # type: ignore[attr-defined]
+            object.__setattr__(self, "_dict_cache", self._build_dict())
+        return dict(self._dict_cache)  # type: ignore[attr-defined]
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes (built once per instance; matches to_dict())."""
+        if self._json_cache is None:  # type: ignore[attr-defined]
+            object.__setattr__(self, "_json_cache", orjson.dumps(self.to_dict()))  # type: ignore[attr-defined]
+        return self._json_cache  # type: ignore[attr-defined,no-any-return]
+
+
+@dataclass(slots=True, frozen=True)
+class Single(_ModeJSONMixin):
     """Single selection mode with customization options.
 
     Use when you need options beyond the simple mode="single" string:
@@ -87,9 +116,10 @@ class Single:
     selected: str | None = None
     allow_deselect: bool = True
     aes: IndexedAesthetic | ByGroup | None = None
+    _dict_cache: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+    _json_cache: bytes | None = field(default=None, init=False, repr=False, compare=False)
 
-    def to_dict(self) -> dict[str, Any]:
-        """Serialize for JavaScript."""
+    def _build_dict(self) -> dict[str, Any]:
         result: dict[str, Any] = {
             "type": "single",
             "allowDeselect": self.allow_deselect,
@@ -101,8 +131,8 @@ class Single:
         return result
 
 
-@dataclass
-class Multiple:
+@dataclass(slots=True, frozen=True)
+class Multiple(_ModeJSONMixin):
     """Multiple selection mode with customization options.
 
     Use when you need options beyond the simple mode="multiple" string:
@@ -135,17 +165,22 @@ class Multiple:
         ... )
     """
 
-    selected: list[str] | None = None
+    selected: Sequence[str] | None = None
     max_selection: int | None = None
     aes: IndexedAesthetic | ByGroup | None = None
+    _dict_cache: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+    _json_cache: bytes | None = field(default=None, init=False, repr=False, compare=False)
 
-    def to_dict(self) -> dict[str, Any]:
-        """Serialize for JavaScript."""
+    def __post_init__(self):
+        if self.selected is not None:
+            object.__setattr__(self, "selected", tuple(self.selected))
+
+    def _build_dict(self) -> dict[str, Any]:
         result: dict[str, Any] = {
             "type": "multiple",
         }
         if self.selected is not None:
-            result["selected"] = self.selected
+            result["selected"] = list(self.selected)
         if self.max_selection is not None:
             result["maxSelection"] = self.max_selection
         if self.aes is not None:
@@ -153,8 +188,8 @@ class Multiple:
         return result
 
 
-@dataclass
-class Cycle:
+@dataclass(slots=True, frozen=True)
+class Cycle(_ModeJSONMixin):
     """Cycle mode - finite state cycling (e.g., traffic light survey).
 
     Each click cycles through n states: 0 -> 1 -> 2 -> ... -> n-1 -> 0.
@@ -189,28 +224,31 @@ class Cycle:
     """
 
     n: int
-    values: dict[str, int] | None = None
+    values: Mapping[str, int] | None = None
     aes: IndexedAesthetic | ByGroup | None = None
+    _dict_cache: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+    _json_cache: bytes | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.n < 2:
             raise ValueError("Cycle.n must be at least 2")
+        if self.values is not None:
+            object.__setattr__(self, "values", MappingProxyType(dict(self.values)))
 
-    def to_dict(self) -> dict[str, Any]:
-        """Serialize for JavaScript."""
+    def _build_dict(self) -> dict[str, Any]:
         result: dict[str, Any] = {
             "type": "cycle",
             "n": self.n,
         }
         if self.values is not None:
-            result["values"] = self.values
+            result["values"] = dict(self.values)
         if self.aes is not None:
             result["aesIndexed"] = _serialize_aes(self.aes)
         return result
 
 
-@dataclass
-class Count:
+@dataclass(slots=True, frozen=True)
+class Count(_ModeJSONMixin):
     """Count mode - unbounded counting.
 
     Each click increments the count. Use with aes.Indexed to define
@@ -250,17 +288,22 @@ class Count:
         ... )
     """
 
-    values: dict[str, int] | None = None
+    values: Mapping[str, int] | None = None
     max_count: int | None = None
     aes: IndexedAesthetic | ByGroup | None = None
+    _dict_cache: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+    _json_cache: bytes | None = field(default=None, init=False, repr=False, compare=False)
 
-    def to_dict(self) -> dict[str, Any]:
-        """Serialize for JavaScript."""
+    def __post_init__(self):
+        if self.values is not None:
+            object.__setattr__(self, "values", MappingProxyType(dict(self.values)))
+
+    def _build_dict(self) -> dict[str, Any]:
         result: dict[str, Any] = {
             "type": "count",
         }
         if self.values is not None:
-            result["values"] = self.values
+            result["values"] = dict(self.values)
         if self.max_count is not None:
             result["maxCount"] = self.max_count
         if self.aes is not None:
@@ -268,25 +311,88 @@ class Count:
         return result
 
 
+def _dispatch[F](table: dict[type, F], obj: Any) -> F | None:
+    """Look up obj's handler by exact type, falling back to isinstance() for subclasses."""
+    handler = table.get(type(obj))
+    if handler is None:
+        for cls, candidate in table.items():
+            if isinstance(obj, cls):
+                return candidate
+    return handler
+
+
+def _indexed_to_data(aes: IndexedAesthetic) -> dict[str, Any]:
+    return {"type": "indexed", "value": aes.to_dict()}
+
+
+def _bygroup_to_data(aes: ByGroup) -> dict[str, Any]:
+    # ByGroup wrapping IndexedAesthetic
+    groups = {
+        key: to_dict()
+        for key, value in aes.items()
+        if (to_dict := getattr(value, "to_dict", None)) is not None
+    }
+    return {"type": "byGroup", "groups": groups}
+
+
+# Exact-type dispatch for the common cases; subclasses fall back to isinstance()
+_AES_SERIALIZERS: dict[type, Callable[[Any], dict[str, Any]]] = {
+    IndexedAesthetic: _indexed_to_data,
+    ByGroup: _bygroup_to_data,
+}
+
+
 def _serialize_aes(aes: Any) -> dict[str, Any]:
     """Serialize aes.Indexed or aes.ByGroup to dict for JavaScript."""
-    from ._aesthetics import ByGroup, IndexedAesthetic
-
-    if isinstance(aes, IndexedAesthetic):
-        return {"type": "indexed", "value": aes.to_dict()}
-    elif isinstance(aes, ByGroup):
-        # ByGroup wrapping IndexedAesthetic
-        groups = {}
-        for key, value in aes.items():
-            if isinstance(value, IndexedAesthetic):
-                groups[key] = value.to_dict()
-            elif hasattr(value, "to_dict"):
-                groups[key] = value.to_dict()
-        return {"type": "byGroup", "groups": groups}
-    elif hasattr(aes, "to_dict"):
-        return aes.to_dict()  # type: ignore[no-any-return]
-    else:
-        return aes  # type: ignore[no-any-return]
+    handler = _dispatch(_AES_SERIALIZERS, aes)
+    if handler is not None:
+        return handler(aes)
+    to_dict = getattr(aes, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()  # type: ignore[no-any-return]
+    return aes  # type: ignore[no-any-return]
+
+
+# Initial value (region -> count) declared on each mode type
+_INITIAL_VALUES: dict[type, Callable[[Any], dict[str, int] | None]] = {
+    Single: lambda m: {m.selected: 1} if m.selected is not None else None,
+    Multiple: lambda m: dict.fromkeys(m.selected, 1) if m.selected is not None else None,
+    Cycle: lambda m: dict(m.values) if m.values is not None else None,
+    Count: lambda m: dict(m.values) if m.values is not None else None,
+}
+
+
+def _initial_value(mode: Single | Multiple | Cycle | Count) -> dict[str, int] | None:
+    """Return the initial value declared by a mode, or None if it declares none."""
+    extract = _dispatch(_INITIAL_VALUES, mode)
+    return extract(mode) if extract is not None else None
+
+
+# String modes resolve to these shared instances; modes are frozen, so sharing is safe
+_STRING_MODES: dict[str, Single | Multiple] = {"single": Single(), "multiple": Multiple()}
+
+
+@lru_cache(maxsize=256)
+def _serialize_hashable_mode(mode: Single | Multiple | Cycle | Count) -> bytes:
+    return mode.to_json_bytes()
+
+
+def _serialize_mode(mode: Single | Multiple | Cycle | Count) -> bytes:
+    """Serialize a mode to JSON bytes, sharing one result across equal configurations.
+
+    Frozen modes hash by value, so e.g. every mode="single" map reuses the same
+    serialized bytes. Cycle and Count modes with values, and modes whose aes holds
+    lists or groups, are unhashable and fall back to the per-instance
+    to_json_bytes() cache. Both caches are safe because modes freeze their
+    containers on construction.
+    """
+    # Check hashability up front so encode errors (orjson.JSONEncodeError is a
+    # TypeError) propagate instead of being retried down the per-instance path
+    try:
+        hash(mode)
+    except TypeError:
+        return mode.to_json_bytes()
+    return _serialize_hashable_mode(mode)
 
 
 # Type alias for mode parameter
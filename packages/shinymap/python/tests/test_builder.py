@@ -172,3 +172,182 @@ def test_static_params_builder_precedence():
 
     # Cleanup
     del _static_map_params["test_map2"]
+
+
+@pytest.mark.unit
+def test_static_params_aes_group_merge():
+    """Test that builder aes overrides static aes while merging group entries."""
+    from shinymap._ui import MapBuilder, _apply_static_params, _static_map_params
+
+    _static_map_params["test_map3"] = {
+        "aes": {
+            "base": {"fillColor": "#eee"},
+            "group": {"line1": {"kind": "line"}, "a": {"fillColor": "#111"}},
+        },
+    }
+
+    builder = MapBuilder().with_aes(
+        {"base": {"fillColor": "#fff"}, "group": {"a": {"fillColor": "#222"}}}
+    )
+    merged = _apply_static_params(builder, "test_map3")
+
+    assert merged._aes == {
+        "base": {"fillColor": "#fff"},
+        "group": {"line1": {"kind": "line"}, "a": {"fillColor": "#222"}},
+    }
+
+    # Cleanup
+    del _static_map_params["test_map3"]
+
+
+class _FakeSession:
+    """Records on_flush callbacks and sent messages in place of a Shiny session."""
+
+    def __init__(self):
+        self.flush_callbacks = []
+        self.messages = []
+
+    def root_scope(self):
+        return self
+
+    def ns(self, id):
+        return id
+
+    def on_flush(self, fn, once=True):
+        self.flush_callbacks.append(fn)
+
+    def _send_message_sync(self, message):
+        self.messages.append(message)
+
+
+class _FakeModuleSession:
+    """Namespaced view of a _FakeSession, like Shiny's SessionProxy."""
+
+    def __init__(self, root, prefix):
+        self._root = root
+        self._prefix = prefix
+
+    def root_scope(self):
+        return self._root
+
+    def ns(self, id):
+        return f"{self._prefix}-{id}"
+
+    def on_flush(self, fn, once=True):
+        self._root.on_flush(fn, once)
+
+    def _send_message_sync(self, message):
+        self._root._send_message_sync(message)
+
+
+@pytest.mark.unit
+def test_update_map_merges_calls_within_flush():
+    """Test that update_map() queues updates during a reactive update and sends on flush."""
+    import asyncio
+
+    from shiny import reactive
+
+    from shinymap._ui import update_map
+
+    session = _FakeSession()
+
+    async def observer():
+        # Shiny holds the reactive lock while running observers
+        async with reactive.lock():
+            update_map("m", fill_color="#f00", session=session)
+            update_map("m", value={"a": 1}, fill_color="#0f0", session=session)
+            update_map("other", max_selection=2, session=session)
+
+    asyncio.run(observer())
+
+    assert session.messages == []
+    assert len(session.flush_callbacks) == 1
+
+    session.flush_callbacks[0]()
+    assert session.messages == [
+        {
+            "custom": {
+                "shinymap-update": {"id": "m", "updates": {"fillColor": "#0f0", "value": {"a": 1}}}
+            }
+        },
+        {"custom": {"shinymap-update": {"id": "other", "updates": {"maxSelection": 2}}}},
+    ]
+
+
+@pytest.mark.unit
+def test_update_map_queues_module_calls_on_root_session():
+    """Test that module and root calls share one queue, keyed by namespaced map id."""
+    import asyncio
+
+    from shiny import reactive
+
+    from shinymap._ui import update_map
+
+    root = _FakeSession()
+    module = _FakeModuleSession(root, "mod")
+
+    async def observer():
+        async with reactive.lock():
+            update_map("m", fill_color="#f00", session=module)
+            update_map("m", fill_color="#0f0", session=root)
+            update_map("m", value={"a": 1}, session=module)
+
+    asyncio.run(observer())
+
+    assert len(root.flush_callbacks) == 1
+    root.flush_callbacks[0]()
+    assert [m["custom"]["shinymap-update"] for m in root.messages] == [
+        {"id": "m", "updates": {"fillColor": "#f00", "value": {"a": 1}}},
+        {"id": "m", "updates": {"fillColor": "#0f0"}},
+    ]
+
+
+@pytest.mark.unit
+def test_update_map_queues_while_another_session_holds_lock():
+    """Test that a call outside any update waits for the flush of a session holding the lock."""
+    import asyncio
+
+    from shiny import reactive
+
+    from shinymap._ui import update_map
+
+    session = _FakeSession()
+
+    async def main():
+        locked = asyncio.Event()
+        release = asyncio.Event()
+
+        async def other_session_update():
+            async with reactive.lock():
+                locked.set()
+                await release.wait()
+
+        task = asyncio.create_task(other_session_update())
+        await locked.wait()
+        # e.g. a download handler in this session, not itself holding the lock
+        update_map("m", fill_color="#f00", session=session)
+        release.set()
+        await task
+
+    asyncio.run(main())
+
+    # Shiny flushes every session at the end of any reactive update
+    assert session.messages == []
+    session.flush_callbacks[0]()
+    assert session.messages == [
+        {"custom": {"shinymap-update": {"id": "m", "updates": {"fillColor": "#f00"}}}}
+    ]
+
+
+@pytest.mark.unit
+def test_update_map_sends_immediately_outside_flush():
+    """Test that update_map() outside a reactive update (e.g. a download handler) sends now."""
+    from shinymap._ui import update_map
+
+    session = _FakeSession()
+    update_map("m", fill_color="#f00", session=session)
+
+    assert session.flush_callbacks == []
+    assert session.messages == [
+        {"custom": {"shinymap-update": {"id": "m", "updates": {"fillColor": "#f00"}}}}
+    ]
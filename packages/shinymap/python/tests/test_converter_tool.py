@@ -0,0 +1,99 @@
+"""Tests for converter helper functions (load_file, generate_code)."""
+
+from pathlib import Path
+
+import pytest
+
+from shinymap.geometry.converter._tool import cached_infer_relabel, load_file
+
+SVG_CONTENT = """<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">
+  <path d="M 10 10 L 40 10 L 40 40 L 10 40 Z"/>
+  <path id="bottom" d="M 10 60 L 90 60 L 90 90 L 10 90 Z"/>
+</svg>
+"""
+
+
+@pytest.mark.unit
+def test_load_file_reuses_geometry_for_identical_content(tmp_path: Path):
+    """Re-uploading the same content under a new path skips re-parsing."""
+    first = tmp_path / "first.svg"
+    second = tmp_path / "second.svg"
+    first.write_text(SVG_CONTENT)
+    second.write_text(SVG_CONTENT)
+
+    data1 = load_file(str(first), "map.svg")
+    data2 = load_file(str(second), "map.svg")
+
+    assert data1["geometry"] is data2["geometry"]
+    assert data2["file_path"] == str(second)
+    assert data2["path_ids"] == ["path_1", "bottom"]
+
+
+@pytest.mark.unit
+def test_load_file_reparses_changed_content(tmp_path: Path):
+    """Different content under the same path is parsed again."""
+    path = tmp_path / "map.svg"
+    path.write_text(SVG_CONTENT)
+    data1 = load_file(str(path), "map.svg")
+
+    path.write_text(SVG_CONTENT.replace('id="bottom"', 'id="lower"'))
+    data2 = load_file(str(path), "map.svg")
+
+    assert data1["geometry"] is not data2["geometry"]
+    assert data2["path_ids"] == ["path_1", "lower"]
+
+
+@pytest.mark.unit
+def test_load_file_json_uses_original_source(tmp_path: Path):
+    """JSON input is parsed from bytes and reports its recorded original source."""
+    path = tmp_path / "intermediate.json"
+    path.write_text('{"_metadata": {"original_source": "map.svg"}, "path_1": ["M 0 0 L 10 10"]}')
+
+    data = load_file(str(path), "intermediate.json")
+
+    assert data["original_source"] == "map.svg"
+    assert data["path_ids"] == ["path_1"]
+    assert data["geometry"].regions["path_1"] == ["M 0 0 L 10 10"]
+
+
+@pytest.mark.unit
+def test_cached_infer_relabel_reuses_result(tmp_path: Path):
+    """Same original content and final JSON return the cached mapping."""
+    original = tmp_path / "original.svg"
+    original.write_text(SVG_CONTENT)
+    final = {
+        "_metadata": {"viewBox": "0 0 100 100"},
+        "top": [{"type": "path", "d": "M 10 10 L 40 10 L 40 40 L 10 40 Z"}],
+        "bottom": [{"type": "path", "d": "M 10 60 L 90 60 L 90 90 L 10 90 Z"}],
+    }
+
+    relabel1 = cached_infer_relabel(str(original), final)
+    relabel2 = cached_infer_relabel(str(original), dict(final))
+
+    assert relabel1 == {"top": "path_1"}
+    assert relabel2 is relabel1
+
+
+@pytest.mark.unit
+def test_relabeling_map_fills_regions_by_registration(tmp_path: Path):
+    """The relabel tab map renders with registered/unregistered fills and wash styling."""
+    import json
+
+    from shinymap.geometry.converter._app import _relabeling_map
+
+    path = tmp_path / "map.svg"
+    path.write_text(SVG_CONTENT)
+    geo = load_file(str(path), "map.svg")["geometry"]
+
+    tag = _relabeling_map(geo, {"bottom"})
+    div = next(child for child in tag if getattr(child, "name", None) == "div")
+    props = json.loads(div.attrs["data-shinymap-props"])
+
+    assert props["aes"]["group"] == {
+        "path_1": {"fillColor": "#cbd5e1"},
+        "bottom": {"fillColor": "#f8fafc"},
+    }
+    assert props["aes"]["base"] == {"strokeColor": "#64748b", "strokeWidth": 1}
+    assert props["aes"]["select"] == {"strokeColor": "#11203b", "strokeWidth": 5}
+    assert props["mode"]["type"] == "multiple"
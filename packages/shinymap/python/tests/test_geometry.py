@@ -1141,3 +1141,164 @@ def test_geometry_oop_equivalence_with_functional(sample_svg_file):
 
     # Should be identical
     assert result_functional == result_oop
+
+
+@pytest.mark.unit
+def test_geometry_viewbox_reuses_computed_bounds():
+    """Computed bounds are cached per instance and shared across paddings."""
+    from shinymap.geometry import Geometry
+
+    geo = Geometry.from_dict({"a": ["M 0 0 L 100 100"], "b": ["M 50 50 L 200 100"]})
+
+    assert geo.viewbox(padding=0) == (0.0, 0.0, 200.0, 100.0)
+    cached = geo._bounds_cache
+    assert geo.viewbox() == (-4.0, -2.0, 208.0, 104.0)
+    assert geo._bounds_cache is cached
+    assert geo == Geometry.from_dict({"a": ["M 0 0 L 100 100"], "b": ["M 50 50 L 200 100"]})
+
+
+@pytest.mark.unit
+def test_geometry_viewbox_recomputed_after_region_edit():
+    """Editing regions in place invalidates the cached element bounds."""
+    from shinymap.geometry import Circle, Geometry
+
+    geo = Geometry.from_dict({"a": ["M 0 0 L 100 100"]})
+    assert geo.viewbox(padding=0) == (0.0, 0.0, 100.0, 100.0)
+
+    geo.regions["b"] = [Circle(cx=300, cy=50, r=10)]
+    assert geo.viewbox(padding=0) == (0.0, 0.0, 310.0, 100.0)
+
+    geo.regions["b"].append(Circle(cx=50, cy=400, r=10))
+    assert geo.viewbox(padding=0) == (0.0, 0.0, 310.0, 410.0)
+
+    del geo.regions["b"]
+    assert geo.viewbox(padding=0) == (0.0, 0.0, 100.0, 100.0)
+
+
+@pytest.mark.unit
+def test_geometry_metadata_methods_copy_regions():
+    """Metadata-only transformations copy the regions mapping but share its elements."""
+    from shinymap.geometry import Geometry
+
+    geo = Geometry.from_dict({"a": ["M 0 0 L 100 100"], "_border": ["M 0 0 L 100 0"]})
+    geo.viewbox()
+
+    for derived in (
+        geo.set_overlays(["_border"]),
+        geo.update_metadata({"source": "Test"}),
+        geo.path_as_line("_border"),
+    ):
+        assert derived.regions == geo.regions
+        assert derived.regions is not geo.regions
+        assert derived.regions["a"] is geo.regions["a"]
+        assert derived._bounds_cache is None
+        derived.regions["b"] = ["M 0 0 L 500 500"]
+        assert "b" not in geo.regions
+    assert geo.metadata == {}
+    assert geo.viewbox(padding=0) == (0.0, 0.0, 100.0, 100.0)
+
+
+@pytest.mark.unit
+def test_input_map_reuses_geometry_payload():
+    """Rendering the same Geometry twice serializes its regions only once."""
+    from shinymap import input_map
+    from shinymap._base import _geometry_payload
+    from shinymap.geometry import Circle, Geometry
+
+    geo = Geometry(regions={"a": ["M 0 0 L 10 0"], "b": [Circle(cx=1, cy=2, r=3)]})
+    input_map("map1", geo, "single")
+    payload = _geometry_payload(geo.regions)
+
+    input_map("map2", geo, "multiple")
+
+    assert _geometry_payload(geo.regions) is payload
+    # Derived geometries and copied region mappings hold the same elements
+    assert _geometry_payload(geo.set_overlays([]).regions) is payload
+    assert _geometry_payload(geo.main_regions()) is payload
+    assert payload == {
+        "a": [{"type": "path", "d": "M 0 0 L 10 0"}],
+        "b": [{"type": "circle", "cx": 1, "cy": 2, "r": 3}],
+    }
+
+
+@pytest.mark.unit
+def test_geometry_payload_rebuilt_after_region_edit():
+    """Editing regions in place after a render is reflected in the next render."""
+    from shinymap import Map
+    from shinymap.geometry import Circle, Geometry
+
+    geo = Geometry(regions={"a": ["M 0 0 L 10 0"]})
+    first = Map(geo).as_json()["geometry"]
+
+    geo.regions["a"] = [Circle(cx=1, cy=2, r=3)]
+    second = Map(geo).as_json()["geometry"]
+
+    geo.regions["a"].append("M 5 5 L 6 6")
+    geo.regions["b"] = ["M 1 1 L 2 2"]
+    third = Map(geo).as_json()["geometry"]
+
+    assert first == {"a": [{"type": "path", "d": "M 0 0 L 10 0"}]}
+    assert second == {"a": [{"type": "circle", "cx": 1, "cy": 2, "r": 3}]}
+    assert third == {
+        "a": [{"type": "circle", "cx": 1, "cy": 2, "r": 3}, {"type": "path", "d": "M 5 5 L 6 6"}],
+        "b": [{"type": "path", "d": "M 1 1 L 2 2"}],
+    }
+
+
+@pytest.mark.unit
+def test_render_map_reuses_output_map_geometry_payload():
+    """render_map passes reuse the geometry payload for output_map() static geometry."""
+    from shinymap import Map, output_map
+    from shinymap._ui import _apply_static_params, _static_map_params
+    from shinymap.geometry import Geometry
+
+    geo = Geometry(regions={"a": ["M 0 0 L 10 0"]})
+    output_map("payload_map", geo)
+    try:
+        first = _apply_static_params(Map(), "payload_map").as_json()
+        second = _apply_static_params(Map(), "payload_map").as_json()
+
+        assert second["geometry"] is first["geometry"]
+        assert first["geometry"] == {"a": [{"type": "path", "d": "M 0 0 L 10 0"}]}
+    finally:
+        del _static_map_params["payload_map"]
+
+
+@pytest.mark.unit
+def test_geometry_to_json_float_format_round_trip(tmp_path):
+    """to_json() writes orjson number formatting; small and large floats round-trip."""
+    from shinymap.geometry import Circle, Geometry
+
+    geo = Geometry(
+        regions={"a": [Circle(cx=1e-05, cy=1.5e20, r=0.1)]},
+        metadata={"scale": 1.5e-07, "extent": 1e20},
+    )
+    output = tmp_path / "geo.json"
+    geo.to_json(output)
+
+    # orjson formatting differs from json.dump (which wrote 1e-05 and 1.5e-07)
+    text = output.read_text()
+    assert '"cx": 0.00001,' in text
+    assert '"cy": 1.5e+20,' in text
+    assert '"scale": 1.5e-7,' in text
+    assert '"extent": 1e+20' in text
+
+    loaded = Geometry.from_json(output)
+    assert loaded.metadata == {"scale": 1.5e-07, "extent": 1e20}
+    circle = loaded.regions["a"][0]
+    assert (circle.cx, circle.cy, circle.r) == (1e-05, 1.5e20, 0.1)
+
+
+@pytest.mark.unit
+def test_geometry_to_json_non_finite_and_wide_ints(tmp_path):
+    """NaN is written as null, and integers wider than 64 bits are rejected."""
+    import orjson
+
+    from shinymap.geometry import Geometry
+
+    output = tmp_path / "geo.json"
+    Geometry(regions={"a": ["M 0 0"]}, metadata={"value": float("nan")}).to_json(output)
+    assert Geometry.from_json(output).metadata == {"value": None}
+
+    with pytest.raises(orjson.JSONEncodeError):
+        Geometry(regions={"a": ["M 0 0"]}, metadata={"count": 2**70}).to_json(output)
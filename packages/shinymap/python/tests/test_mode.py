@@ -0,0 +1,161 @@
+"""Tests for Mode classes (Single, Multiple, Cycle, Count)."""
+
+import dataclasses
+
+import orjson
+import pytest
+
+from shinymap import aes
+from shinymap.mode import (
+    Count,
+    Cycle,
+    ModeType,
+    Multiple,
+    Single,
+    _initial_value,
+    _serialize_mode,
+)
+
+
+class TestModeToDict:
+    """Tests for Mode.to_dict() serialization."""
+
+    def test_single_defaults(self):
+        assert Single().to_dict() == {"type": "single", "allowDeselect": True}
+
+    def test_multiple_with_limit(self):
+        mode = Multiple(selected=["a"], max_selection=3)
+        assert mode.to_dict() == {"type": "multiple", "selected": ["a"], "maxSelection": 3}
+
+    def test_cycle_with_indexed_aes(self):
+        mode = Cycle(n=2, aes=aes.Indexed(fill_color=["#e5e7eb", "#3b82f6"]))
+        assert mode.to_dict() == {
+            "type": "cycle",
+            "n": 2,
+            "aesIndexed": {"type": "indexed", "value": {"fillColor": ["#e5e7eb", "#3b82f6"]}},
+        }
+
+    def test_count_with_by_group_aes(self):
+        mode = Count(max_count=4, aes=aes.ByGroup(a=aes.Indexed(fill_color=["#fff", "#000"])))
+        assert mode.to_dict() == {
+            "type": "count",
+            "maxCount": 4,
+            "aesIndexed": {"type": "byGroup", "groups": {"a": {"fillColor": ["#fff", "#000"]}}},
+        }
+
+    def test_to_dict_is_built_once(self):
+        """Repeated serialization copies the cached dict instead of rebuilding it."""
+        mode = Multiple(max_selection=2)
+        first = mode.to_dict()
+        assert mode._dict_cache is not None
+        assert first == mode.to_dict()
+        first["maxSelection"] = 5
+        assert mode.to_dict() == {"type": "multiple", "maxSelection": 2}
+
+    def test_containers_frozen_on_construction(self):
+        """Mutating the containers passed in cannot make the cached dict stale."""
+        selected = ["a"]
+        values = {"a": 1}
+        multiple = Multiple(selected=selected)
+        cycle = Cycle(n=3, values=values)
+        count = Count(values=values)
+        selected.append("b")
+        values["b"] = 2
+        assert multiple.to_dict() == {"type": "multiple", "selected": ["a"]}
+        assert cycle.to_dict() == {"type": "cycle", "n": 3, "values": {"a": 1}}
+        assert count.to_dict() == {"type": "count", "values": {"a": 1}}
+        assert multiple == Multiple(selected=("a",))
+        with pytest.raises(TypeError):
+            cycle.values["b"] = 2  # type: ignore[index]
+
+    def test_cache_excluded_from_eq_and_repr(self):
+        mode = Single(selected="a")
+        mode.to_dict()
+        assert mode == Single(selected="a")
+        assert "_dict_cache" not in repr(mode)
+
+
+class TestModeImmutability:
+    """Mode instances are frozen so cached serialization cannot go stale."""
+
+    def test_assignment_raises(self):
+        mode = Multiple(max_selection=2)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            mode.max_selection = 3  # type: ignore[misc]
+
+    def test_cycle_validates_n(self):
+        with pytest.raises(ValueError, match="at least 2"):
+            Cycle(n=1)
+
+
+class TestSerializeMode:
+    """Tests for JSON serialization and _serialize_mode() interning."""
+
+    def test_to_json_bytes_matches_to_dict(self):
+        mode = Cycle(n=3, values={"a": 1})
+        assert orjson.loads(mode.to_json_bytes()) == mode.to_dict()
+        assert mode.to_json_bytes() is mode.to_json_bytes()
+
+    def test_equal_modes_share_bytes(self):
+        assert _serialize_mode(Single()) is _serialize_mode(Single())
+        assert _serialize_mode(Multiple(max_selection=3)) is _serialize_mode(
+            Multiple(max_selection=3)
+        )
+
+    def test_unhashable_mode_falls_back(self):
+        mode = Count(values={"a": 1, "b": 2})
+        assert orjson.loads(_serialize_mode(mode)) == {"type": "count", "values": {"a": 1, "b": 2}}
+        assert _serialize_mode(mode) is mode.to_json_bytes()
+
+    def test_bytes_unaffected_by_input_mutation(self):
+        selected = ["a"]
+        values = {"a": 1}
+        multiple = Multiple(selected=selected)
+        count = Count(values=values)
+        first = _serialize_mode(multiple), _serialize_mode(count)
+        selected.append("b")
+        values["b"] = 2
+        assert (_serialize_mode(multiple), _serialize_mode(count)) == first
+        assert (
+            _serialize_mode(Multiple(selected=selected))
+            == b'{"type":"multiple","selected":["a","b"]}'
+        )
+
+    def test_encode_error_propagates(self):
+        # A hashable mode that orjson cannot encode raises instead of being retried
+        with pytest.raises(orjson.JSONEncodeError):
+            _serialize_mode(Single(selected=object()))  # type: ignore[arg-type]
+
+    def test_indexed_aes_dict_is_cached(self):
+        indexed = aes.Indexed(fill_color=["#fff", "#000"])
+        assert indexed.to_dict() is indexed.to_dict()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            indexed.fill_color = "#f00"  # type: ignore[misc]
+
+
+class TestInitialValue:
+    """Tests for _initial_value() extraction."""
+
+    def test_single_selected(self):
+        assert _initial_value(Single(selected="a")) == {"a": 1}
+
+    def test_multiple_selected(self):
+        assert _initial_value(Multiple(selected=["a", "b"])) == {"a": 1, "b": 1}
+
+    def test_cycle_and_count_values(self):
+        assert _initial_value(Cycle(n=3, values={"a": 2})) == {"a": 2}
+        assert _initial_value(Count(values={"b": 5})) == {"b": 5}
+
+    def test_none_when_not_declared(self):
+        assert _initial_value(Single()) is None
+        assert _initial_value(Multiple()) is None
+        assert _initial_value(Count()) is None
+
+
+class TestModeType:
+    """ModeType is a runtime union usable with isinstance()."""
+
+    def test_isinstance(self):
+        assert isinstance("single", ModeType)
+        assert isinstance(Cycle(n=2), ModeType)
+        assert not isinstance(3, ModeType)